@@ -0,0 +1,70 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Compares the time that the regex engines take to search content for warnings
+
+Run ``python benchmarks/regex_engines.py`` with the ``google-re2`` package installed. Each case is searched with both
+engines, which must find the same amount of warnings. Logfiles that are given as arguments are searched with all regex
+checkers as well.
+"""
+
+import argparse
+import logging
+import time
+
+from mlx.warnings import WarningsPlugin
+from mlx.warnings.regex_engines import Re2Engine, RegexEngine
+
+CASES = (
+    ('exclude "(a+)+b", 5 warnings of 20 a\'s', ("doxygen",),
+     "".join(f"f.c:{i}: warning: {'a' * 20}c\n" for i in range(5)), [r"(a+)+b"]),
+    ('exclude ".*.*=.*;", 100 warnings', ("doxygen",),
+     "".join(f"f.c:{i}: warning: {'x' * 300}\n" for i in range(100)), [r".*.*=.*;"]),
+    ("Coverity, line with a 20k-character path", ("coverity",), "a" * 20000 + " CID x\n", None),
+    ("Sphinx, 100k warnings", ("sphinx",),
+     "".join(f"doc/{i}.rst:{i}: WARNING: toctree\n" for i in range(100000)), None),
+)
+REGEX_CHECKERS = ("doxygen", "sphinx", "xmlrunner", "coverity")
+
+
+def search(engine, names, content, exclude=None):
+    """Searches content for warnings with the given regex engine
+
+    Args:
+        engine (RegexEngine): The regex engine
+        names (tuple[str]): Names of the checkers to activate
+        content (str): The content to search
+        exclude (list[str]/None): Regexes to exclude warnings with
+
+    Returns:
+        float: Amount of seconds that the search took
+        int: Amount of warnings found
+    """
+    warnings = WarningsPlugin()
+    warnings.regex_engine = engine
+    for name in names:
+        checker = warnings.activate_checker_name(name, False, None)
+        if exclude:
+            checker.add_patterns(exclude, checker.exclude_patterns)
+    start = time.perf_counter()
+    warnings.check(content)
+    return time.perf_counter() - start, warnings.return_count()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("logfiles", nargs="*", help="Logfiles to search with all regex checkers")
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+    cases = list(CASES)
+    for path in args.logfiles:
+        with open(path) as logfile:
+            cases.append((f"{path}, all regex checkers", REGEX_CHECKERS, logfile.read(), None))
+    engines = (RegexEngine(), Re2Engine())
+    for description, names, content, exclude in cases:
+        (re_time, re_count), (re2_time, re2_count) = (search(engine, names, content, exclude) for engine in engines)
+        if re_count != re2_count:
+            raise SystemExit(f"{description}: {re_count} warnings with re, {re2_count} with re2")
+        print(f"{description:45} re {re_time:8.3f} s   re2 {re2_time:8.3f} s   {re_count} warnings", flush=True)
+
+
+if __name__ == "__main__":
+    main()
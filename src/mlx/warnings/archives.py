@@ -0,0 +1,186 @@
+# SPDX-License-Identifier: Apache-2.0
+
+import fnmatch
+import io
+import tarfile
+import zipfile
+
+from .compression import MAGIC_SIZE, find_compression, open_logfile
+
+MEMBER_SEPARATOR = "!"
+TAR_MAGIC_OFFSET = 257
+ZIP_MAGICS = (b"PK\x03\x04", b"PK\x05\x06")
+HEAD_SIZE = 512
+
+
+def split_member_pattern(pattern):
+    """Splits a path of a logfile into the path of an archive and a pattern for its members
+
+    The first ``!`` that is not inside a ``[...]`` wildcard separates both paths, e.g. ``artifacts.zip!**/*.xml``.
+
+    Args:
+        pattern (str): Path of a logfile, which may contain wildcards
+
+    Returns:
+        str: Path of the archive; the given path if it doesn't contain a member pattern
+        str/None: Pattern for the members of the archive; None if the given path doesn't contain a member pattern
+    """
+    in_brackets = False
+    for index, char in enumerate(pattern):
+        if char == "[":
+            in_brackets = True
+        elif char == "]":
+            in_brackets = False
+        elif char == MEMBER_SEPARATOR and not in_brackets and 0 < index < len(pattern) - 1:
+            return pattern[:index], pattern[index + 1:]
+    return pattern, None
+
+
+def match_member(pattern, name):
+    """Checks whether the name of an archive member matches a pattern
+
+    The wildcards have the same meaning as in paths of logfiles, with ``/`` as separator; ``**`` matches zero or
+    more directories. The match is case-sensitive.
+
+    Args:
+        pattern (str): Pattern for the names of members
+        name (str): Name of the member
+
+    Returns:
+        bool: True if the name matches the pattern
+    """
+    return _match_parts(pattern.split("/"), name.split("/"))
+
+
+def _match_parts(pattern_parts, name_parts):
+    """Checks whether the parts of a name, separated by ``/``, match the parts of a pattern"""
+    if not pattern_parts:
+        return not name_parts
+    part, remaining = pattern_parts[0], pattern_parts[1:]
+    if part == "**":
+        if not remaining:
+            return bool(name_parts)
+        return any(_match_parts(remaining, name_parts[index:]) for index in range(len(name_parts) + 1))
+    if not name_parts or not fnmatch.fnmatchcase(name_parts[0], part):
+        return False
+    return _match_parts(remaining, name_parts[1:])
+
+
+def iter_logfile_contents(path, member_pattern=None):
+    """Yields the content of a logfile, or of each member of an archive, as a text file
+
+    Zip and tar archives are read without extracting them; a tar archive is read as a stream, so it is read only
+    once, even when it is compressed. All files in an archive are parsed, unless a pattern for its members is
+    given. Compressed files, also members of archives, are decompressed while they are read.
+
+    Args:
+        path (str): Path of the logfile or archive
+        member_pattern (str/None): Pattern for the names of the members of the archive to parse
+
+    Yields:
+        _io.TextIOWrapper: The open file or member; it is closed when the next one is yielded
+    """
+    with open(path, "rb") as file:
+        head = file.read(HEAD_SIZE)
+    if head.startswith(ZIP_MAGICS):
+        with zipfile.ZipFile(path) as archive:
+            for info in archive.infolist():
+                if not info.is_dir() and match_member(member_pattern or "**", info.filename):
+                    with archive.open(info) as member:
+                        yield _decode(member)
+        return
+    module = find_compression(head)
+    if module is not None:
+        with module.open(path) as file:
+            head = file.read(HEAD_SIZE)
+    if _is_tar_header(head):
+        with tarfile.open(path, "r|*") as archive:
+            for info in archive:
+                if info.isfile() and match_member(member_pattern or "**", info.name):
+                    with archive.extractfile(info) as member:
+                        yield _decode(member)
+    elif member_pattern is None:
+        with open_logfile(path) as file:
+            yield file
+
+
+def is_plain_logfile(path):
+    """Checks whether a logfile is neither an archive nor compressed, so that a part of it can be read on its own
+
+    Args:
+        path (str): Path of the logfile
+
+    Returns:
+        bool: True if the logfile is a plain file
+    """
+    with open(path, "rb") as file:
+        head = file.read(HEAD_SIZE)
+    return not (head.startswith(ZIP_MAGICS) or find_compression(head) or _is_tar_header(head))
+
+
+def open_logfile_part(path, start, end):
+    """Opens a part of a plain logfile for reading text
+
+    Args:
+        path (str): Path of the logfile
+        start (int): Offset of the first byte of the part, which is the start of a line
+        end (int): Offset right after the last byte of the part
+
+    Returns:
+        _io.TextIOWrapper: The open part of the file
+    """
+    file = open(path, "rb")
+    file.seek(start)
+    return io.TextIOWrapper(io.BufferedReader(_PartReader(file, end - start)))
+
+
+def _is_tar_header(head):
+    """Checks whether the first bytes of a file are the header of a POSIX or GNU tar archive"""
+    return head[TAR_MAGIC_OFFSET:TAR_MAGIC_OFFSET + 5] == b"ustar"
+
+
+def _decode(member):
+    """Wraps an archive member in a text file, which decompresses the member if it is compressed"""
+    buffer = io.BufferedReader(_MemberReader(member))
+    module = find_compression(buffer.peek(MAGIC_SIZE))
+    if module is None:
+        return io.TextIOWrapper(buffer)
+    return module.open(buffer, "rt")
+
+
+class _MemberReader(io.RawIOBase):
+    """Unseekable raw stream that reads an archive member, which is left open when the stream is closed"""
+
+    def __init__(self, member):
+        super().__init__()
+        self._member = member
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        data = self._member.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+
+class _PartReader(io.RawIOBase):
+    """Unseekable raw stream that reads a given amount of bytes of a file, which is closed when the stream is closed"""
+
+    def __init__(self, file, size):
+        super().__init__()
+        self._file = file
+        self._remaining = size
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        data = self._file.read(min(len(buffer), self._remaining))
+        self._remaining -= len(data)
+        buffer[:len(data)] = data
+        return len(data)
+
+    def close(self):
+        self._file.close()
+        super().close()
@@ -19,6 +19,24 @@ class Finding:
             raise ValueError(f"Expected a non empty description; Got {description!r}")
         self.description = description
 
+    @classmethod
+    def from_dict(cls, finding):
+        """Creates a Finding from the dictionary representation of another Finding, e.g. from another process
+
+        Args:
+            finding (dict): The code quality finding as returned by :meth:`to_dict`
+
+        Returns:
+            Finding: The code quality violation, without the fingerprint of the original
+        """
+        obj = cls(finding["description"])
+        obj.severity = finding["severity"]
+        obj.check_name = finding["check_name"]
+        obj.path = finding["location"]["path"]
+        obj.line = finding["location"]["positions"]["begin"]["line"]
+        obj.column = finding["location"]["positions"]["begin"]["column"]
+        return obj
+
     @property
     def fingerprint(self):
         """str: The unique fingerprint to identify this specific code quality violation.
@@ -0,0 +1,68 @@
+# SPDX-License-Identifier: Apache-2.0
+
+import bz2
+import gzip
+import lzma
+
+COMPRESSION_MODULES = {
+    b"\x1f\x8b": gzip,
+    b"BZh": bz2,
+    b"\xfd7zXZ\x00": lzma,
+}
+MAGIC_SIZE = max(len(magic) for magic in COMPRESSION_MODULES)
+DECOMPRESSOR_TYPES = (gzip.GzipFile, bz2.BZ2File, lzma.LZMAFile)
+
+
+def find_compression(head):
+    """Detects the compression format of a file by its magic bytes
+
+    Args:
+        head (bytes): The first bytes of the file
+
+    Returns:
+        module/None: Module of the compression format (gzip, bz2 or lzma); None if the file is not compressed
+    """
+    for magic, module in COMPRESSION_MODULES.items():
+        if head.startswith(magic):
+            return module
+    return None
+
+
+def decompress(file, newline=None):
+    """Wraps an open text file so that its content is decompressed while it is read, if it is compressed
+
+    The gzip, bzip2 and xz formats are supported. The decompressed content is decoded like the content of the
+    given file. The given file remains open when the returned file object is closed.
+
+    Args:
+        file (_io.TextIOWrapper): The open file, of which nothing has been read yet
+        newline (str/None): Controls the line endings of the decompressed content, see ``open``
+
+    Returns:
+        _io.TextIOWrapper: The given file if it is not compressed; otherwise a new file object that decompresses it
+    """
+    buffer = getattr(file, "buffer", None)
+    try:
+        head = buffer.peek(MAGIC_SIZE)
+    except (AttributeError, OSError, ValueError):
+        return file
+    module = find_compression(head)
+    if module is None:
+        return file
+    return module.open(buffer, "rt", encoding=file.encoding, errors=file.errors, newline=newline)
+
+
+def open_logfile(path):
+    """Opens a logfile for reading text, decompressing it while it is read if it is compressed
+
+    Args:
+        path (str): Path of the logfile
+
+    Returns:
+        _io.TextIOWrapper: The open file
+    """
+    with open(path, "rb") as file:
+        module = find_compression(file.read(MAGIC_SIZE))
+    if module is None:
+        return open(path)
+    return module.open(path, "rt")
@@ -0,0 +1,192 @@
+# SPDX-License-Identifier: Apache-2.0
+
+import fnmatch
+import os
+import re
+import stat
+from collections import namedtuple
+
+from .archives import split_member_pattern
+
+MAGIC_CHECK = re.compile(r"[*?[]")
+SEPARATORS = re.compile(r"[\\/]" if os.altsep else re.escape(os.sep))
+
+Logfile = namedtuple("Logfile", ["path", "size", "member"], defaults=[None])
+
+
+class LogfileFinder:
+    """Expands wildcards in paths of logfiles by walking each directory at most once
+
+    The wildcards have the same meaning as for the ``glob`` module with ``recursive=True``: ``**`` matches any files
+    and zero or more directories. Names that start with a dot are only matched by a pattern that starts with a dot.
+    Only regular files are found. A file that has been found already, possibly via another path, is skipped.
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._found = set()
+        self._links = set()
+
+    def find(self, pattern):
+        """Finds the files that match a pattern and that have not been found before
+
+        When no file matches the pattern and it contains a pattern for members of archives, e.g.
+        ``artifacts.zip!**/*.xml``, the archives that match the first part are found instead.
+
+        Args:
+            pattern (str): Path of a logfile, which may contain wildcards
+
+        Returns:
+            list[Logfile]: Path and size of each new file, in the order of the names
+            bool: True when at least one file matches, even when all of them have been found before
+        """
+        logfiles, matched = self._find(pattern)
+        archive_pattern, member_pattern = split_member_pattern(pattern)
+        if matched or member_pattern is None:
+            return logfiles, matched
+        return self._find(archive_pattern, member_pattern)
+
+    def _find(self, pattern, member=None):
+        """Finds the files that match a pattern and that have not been found before
+
+        Args:
+            pattern (str): Path of a logfile, which may contain wildcards
+            member (str/None): Pattern for the members to parse if the files are archives
+
+        Returns:
+            list[Logfile]: Path and size of each new file, in the order of the names
+            bool: True when at least one file matches, even when all of them have been found before
+        """
+        parts = SEPARATORS.split(pattern)
+        index = next((index for index, part in enumerate(parts) if MAGIC_CHECK.search(part)), len(parts))
+        if index == len(parts):
+            return self._find_path(pattern, member)
+        root = os.sep.join(parts[:index])
+        if not root and index:
+            root = os.sep
+        logfiles = []
+        matched = False
+        for path, size in self._match(root, parts[index:]):
+            matched = True
+            key = (os.path.realpath(path), member)
+            if key not in self._found:
+                self._found.add(key)
+                logfiles.append(Logfile(path, size, member))
+        return logfiles, matched
+
+    def _find_path(self, path, member=None):
+        """Finds a single file without wildcards
+
+        Args:
+            path (str): Path of a logfile
+            member (str/None): Pattern for the members to parse if the file is an archive
+
+        Returns:
+            list[Logfile]: Path and size of the file when it exists and has not been found before
+            bool: True when the file exists
+        """
+        size = _file_size(path)
+        if size is None:
+            return [], False
+        key = (os.path.realpath(path), member)
+        if key in self._found:
+            return [], True
+        self._found.add(key)
+        return [Logfile(path, size, member)], True
+
+    def _match(self, directory, parts):
+        """Yields the files in a directory that match the remaining parts of a pattern
+
+        Args:
+            directory (str): Path of the directory, an empty string for the current working directory
+            parts (list[str]): Remaining parts of the pattern, separated by path separators
+
+        Yields:
+            str: Path of the matching file
+            int: Size of the matching file in bytes
+        """
+        part, remaining = parts[0], parts[1:]
+        if part == "**":
+            if remaining:
+                yield from self._match(directory, remaining)
+            for entry in self._list(directory):
+                if entry.name.startswith("."):
+                    continue
+                path = os.path.join(directory, entry.name)
+                if entry.is_dir():
+                    if entry.is_symlink():
+                        # a symbolic link to a directory is followed once, to avoid endless loops
+                        key = (os.path.realpath(path), tuple(parts))
+                        if key in self._links:
+                            continue
+                        self._links.add(key)
+                    yield from self._match(path, parts)
+                elif not remaining and entry.is_file():
+                    yield path, entry.stat().st_size
+        elif MAGIC_CHECK.search(part):
+            entries = self._list(directory)
+            if not part.startswith("."):
+                entries = [entry for entry in entries if not entry.name.startswith(".")]
+            names = set(fnmatch.filter([entry.name for entry in entries], part))
+            for entry in entries:
+                if entry.name not in names:
+                    continue
+                path = os.path.join(directory, entry.name)
+                if remaining:
+                    if entry.is_dir():
+                        yield from self._match(path, remaining)
+                elif entry.is_file():
+                    yield path, entry.stat().st_size
+        elif remaining:
+            yield from self._match(os.path.join(directory, part), remaining)
+        else:
+            path = os.path.join(directory, part)
+            size = _file_size(path)
+            if size is not None:
+                yield path, size
+
+    def _list(self, directory):
+        """Lists a directory once and caches its entries, sorted by name
+
+        Args:
+            directory (str): Path of the directory, an empty string for the current working directory
+
+        Returns:
+            list[os.DirEntry]: Entries of the directory; empty if it cannot be listed
+        """
+        if directory not in self._entries:
+            try:
+                with os.scandir(directory or os.curdir) as iterator:
+                    self._entries[directory] = sorted(iterator, key=lambda entry: entry.name)
+            except OSError:
+                self._entries[directory] = []
+        return self._entries[directory]
+
+
+def _file_size(path):
+    """Returns the size of a regular file in bytes, or None if the path is not a regular file"""
+    try:
+        status = os.stat(path)
+    except (OSError, ValueError):
+        return None
+    return status.st_size if stat.S_ISREG(status.st_mode) else None
+
+
+def discover_logfiles(patterns):
+    """Expands the wildcards in all paths of logfiles at once
+
+    Args:
+        patterns (list[str]): Paths of logfiles, which may contain wildcards
+
+    Returns:
+        list[Logfile]: Path, size and member pattern of each file, without duplicates, in the order of the patterns
+        str/None: The first pattern that doesn't match any file; files of later patterns are not included
+    """
+    finder = LogfileFinder()
+    logfiles = []
+    for pattern in patterns:
+        found, matched = finder.find(pattern)
+        if not matched:
+            return logfiles, pattern
+        logfiles.extend(found)
+    return logfiles, None
@@ -1,17 +1,32 @@
 # SPDX-License-Identifier: Apache-2.0
 
+import logging
+
 try:
     from lxml import etree
 except ImportError:
     from xml.etree import ElementTree as etree
 
-from junitparser import Error, Failure, JUnitXml
+from junitparser import Error, Failure, JUnitXmlError, TestCase
 
 from .warnings_checker import WarningsChecker
 
+RESULT_TAGS = {"failure", "error", "skipped"}
+FAILURE_TAGS = {"failure", "error"}
+
 
 class JUnitChecker(WarningsChecker):
     name = "junit"
+    binary_input = True
+
+    def __init__(self, *logging_args):
+        super().__init__(*logging_args)
+        self._parser = None
+
+    @property
+    def counts_only(self):
+        """bool: True if each failure/error only needs to be counted, since it can't be excluded or logged"""
+        return not (len(self.exclude_patterns) or self.logger.isEnabledFor(logging.INFO))
 
     def check(self, content):
         """Function for counting the number of JUnit failures in a specific text
@@ -19,35 +34,38 @@ class JUnitChecker(WarningsChecker):
         Args:
             content (str): The content to parse
         """
-        try:
-            root_input = etree.fromstring(content.encode("utf-8"))
-            testsuites_root = self.prepare_tree(root_input)
-            suites = JUnitXml.fromelem(testsuites_root)
-            amount_to_exclude = self._traverse_suites(suites)
-            self.count += suites.failures + suites.errors - amount_to_exclude
-        except etree.ParseError as err:
-            self.logger.error(err.msg)
+        self.feed(content)
+        self.flush()
 
-    @property
-    def name_repr(self):
-        return "JUnit" if self.name == "junit" else super().name_repr
+    def feed(self, chunk):
+        """Parses the next chunk of the XML content, checking each test case as soon as it has been parsed
 
-    @staticmethod
-    def prepare_tree(root_input):
-        """Prepares the tree element by adding a testsuites element as root when missing (to please JUnitXml)
+        The failures and errors are counted when :meth:`flush` is called after the last chunk. A failed test case in a
+        nested test suite is only checked then, since it doesn't count if the root element has test cases of its own. Bytes are decoded by
+        the XML parser, according to the encoding declaration of the content. When the failures and errors only need
+        to be counted, the test cases are not built, and only the names of the elements are scanned.
 
         Args:
-            root_input (lxml.etree._Element/xml.etree.ElementTree.Element): Top-level XML element from input file
-
-        Returns:
-            lxml.etree._Element/xml.etree.ElementTree.Element: Top-level XML element with testsuites tag
+            chunk (bytes/str): The next chunk of the content to parse
         """
-        if root_input.tag.startswith("testsuite") and root_input.find("testcase") is None:
-            testsuites_root = root_input
+        if self._parser is None:
+            self._parser = JUnitStreamParser(None if self.counts_only else self._check_testcase)
+        self._parser.feed(chunk.encode("utf-8") if isinstance(chunk, str) else chunk)
+
+    def flush(self):
+        """Counts the failures and errors in the XML content that has been fed by means of :meth:`feed`"""
+        if self._parser is None:
+            return
+        parser, self._parser = self._parser, None
+        amount = parser.close()
+        if amount is None:
+            self.logger.error(parser.error.msg)
         else:
-            testsuites_root = etree.Element("testsuites")
-            testsuites_root.append(root_input)
-        return testsuites_root
+            self.count += amount
+
+    @property
+    def name_repr(self):
+        return "JUnit" if self.name == "junit" else super().name_repr
 
     def _check_testcase(self, testcase):
         """Handles the check of a test case element by checking if the result is a failure/error.
@@ -63,29 +81,199 @@ class JUnitChecker(WarningsChecker):
             int: 1 if a failure/error is to be subtracted from the final count, 0 otherwise
         """
         if isinstance(testcase.result, (Failure, Error)):
-            if self._is_excluded(testcase.result.message):
+            if self._is_excluded(testcase.result.message or ""):
                 return 1
             self.logger.info(f"{testcase.classname}.{testcase.name}")
             self.logger.debug(f"{testcase.classname}.{testcase.name} | {testcase.result.message}")
         return 0
 
-    def _traverse_suites(self, suites):
-        """Traverses through all test suites, including nested suites, to check for test case failures.
 
-        This method performs a depth-first traversal of the test suites.
+class JUnitStreamParser:
+    """Parses JUnit XML incrementally, checking each test case as soon as its end tag has been parsed
+
+    Each element is removed from the tree once it has been parsed completely, so that the memory usage doesn't grow
+    with the size of the content. The test cases in the (nested) test suites are checked in document order. The amount
+    of failures and errors is the same as junitparser reports for the whole tree: the ``failures`` and ``errors``
+    attributes of a root ``testsuites`` element, or of a root test suite without test cases of its own, are used when
+    present; otherwise, the failed test cases of the top-level test suites are counted.
+    A failed test case in a nested test suite only counts when the root element has no test cases of its own, which is
+    known at the end of the content. Therefore, it is checked when the parser is closed, unless a test case of the root
+    element has been parsed already.
+    When the test cases don't need to be checked, only the names of the elements are scanned, without building any
+    elements.
+    """
+
+    def __init__(self, check_testcase=None):
+        """Constructor
+
+        Args:
+            check_testcase (callable/None): Checks a junitparser.TestCase and returns 1 if its failure/error is to be
+                subtracted from the amount, 0 otherwise; None to only count the failures and errors
+        """
+        self.error = None  # the etree.ParseError when the content is not well-formed XML
+        self._check_testcase = check_testcase
+        if check_testcase is None:
+            self._parser = etree.XMLParser(target=_TagTarget(self._start, self._end))
+        else:
+            self._parser = etree.XMLPullParser(events=("start", "end"))
+        self._root_tag = None
+        self._root_attrib = {}
+        self._open_tags = []
+        self._open_elements = []
+        self._testcase_results = []  # names of the result elements of each open test case
+        self._root_results = [0, 0]  # failures and errors of the test cases right below the root element
+        self._suite_results = [0, 0]  # failures and errors of the test cases in the test suites below the root
+        self._has_root_testcases = False
+        self._pending_testcases = []  # failed test cases in nested test suites, to check if there are no root test cases
+        self._has_invalid_testcases = False  # whether a test case has more than one result
+        self._amount_to_exclude = 0
+
+    def feed(self, data):
+        """Parses the next chunk of the content
+
+        Args:
+            data (bytes): The next chunk of the content
+        """
+        if self.error is not None:
+            return
+        try:
+            self._parser.feed(data)
+            self._handle_events()
+        except etree.ParseError as err:
+            self.error = err
+
+    def close(self):
+        """Parses the rest of the content
+
+        Returns:
+            int/None: The amount of failures and errors that are not to be excluded; None if the content is not
+            well-formed XML
+
+        Raises:
+            JUnitXmlError: A test case that is part of a test suite has more than one result
+        """
+        if self.error is None:
+            try:
+                self._parser.close()
+                self._handle_events()
+            except etree.ParseError as err:
+                self.error = err
+        pending_testcases, self._pending_testcases = self._pending_testcases, []
+        if self.error is not None:
+            return None
+        if not self._has_root_testcases:
+            for testcase in pending_testcases:
+                self._amount_to_exclude += self._check_testcase(testcase)
+        return self.count(self._amount_to_exclude)
+
+    def count(self, amount_to_exclude):
+        """Counts the failures and errors in the content that has been parsed completely
 
         Args:
-            suites (junitparser.JUnitXml): A collection of test suites.
+            amount_to_exclude (int): The amount of failures and errors of the checked test cases to subtract, unless
+                the test cases don't count because they're not part of a test suite
 
         Returns:
-            int: The total number of failures to exclude based on the configured regex.
+            int: The amount of failures and errors that are not to be excluded
+
+        Raises:
+            JUnitXmlError: A test case that is part of a test suite has more than one result
         """
-        amount_to_exclude = 0
-        for suite in suites:
-            for testcase in suite:
-                amount_to_exclude += self._check_testcase(testcase)
-            if hasattr(suite, "testsuites"):
-                sub_suites = suite.testsuites()
-                if sub_suites:
-                    amount_to_exclude += self._traverse_suites(sub_suites)
-        return amount_to_exclude
+        if self._root_tag.startswith("testsuite") and not self._has_root_testcases:
+            failures, errors = self._root_attrib.get("failures"), self._root_attrib.get("errors")
+            if failures:
+                amount = int(failures) + (int(errors) if errors else self._suite_results[1])
+            else:
+                amount = sum(self._suite_results)
+        elif self._root_tag == "testsuite":
+            amount = sum(self._root_results)
+        else:
+            return 0  # not a test suite, or test cases outside of a test suite
+        if self._has_invalid_testcases:
+            raise JUnitXmlError("Only one result allowed per test case.")
+        return amount - amount_to_exclude
+
+    def _handle_events(self):
+        """Handles the start and end of each element that has been parsed by the pull parser"""
+        if self._check_testcase is None:
+            return
+        for event, elem in self._parser.read_events():
+            if event == "start":
+                self._open_elements.append(elem)
+                self._start(elem.tag, elem.attrib)
+                continue
+            self._open_elements.pop()
+            self._end(elem.tag, elem)
+            if self._open_elements and not self._testcase_results:
+                self._open_elements[-1].remove(elem)
+
+    def _start(self, tag, attrib):
+        """Handles the start of an element
+
+        Args:
+            tag (str): Name of the element
+            attrib (dict): Attributes of the element
+        """
+        if not self._open_tags:
+            self._root_tag = tag
+            self._root_attrib = dict(attrib)
+        elif tag in RESULT_TAGS and self._open_tags[-1] == "testcase":
+            self._testcase_results[-1].add(tag)
+        if tag == "testcase":
+            self._testcase_results.append(set())
+        self._open_tags.append(tag)
+
+    def _end(self, tag, elem=None):
+        """Handles the end of an element
+
+        Args:
+            tag (str): Name of the element
+            elem (lxml.etree._Element/xml.etree.ElementTree.Element/None): The element; None when scanning names only
+        """
+        self._open_tags.pop()
+        if tag == "testcase":
+            self._handle_testcase(self._testcase_results.pop(), elem)
+
+    def _handle_testcase(self, result_tags, elem):
+        """Counts and checks a test case that is part of a test suite, i.e. of which all ancestors are test suites
+
+        Args:
+            result_tags (set[str]): Names of the result elements of the test case
+            elem (lxml.etree._Element/xml.etree.ElementTree.Element/None): The test case element; None when scanning
+                names only
+        """
+        depth = len(self._open_tags)
+        if depth == 1:
+            self._has_root_testcases = True
+            if self._root_tag != "testsuite":
+                return
+        elif not self._root_tag.startswith("testsuite"):
+            return
+        elif any(tag != "testsuite" for tag in self._open_tags[1:]):
+            return
+        if len(result_tags) > 1:
+            self._has_invalid_testcases = True
+            return
+        if depth <= 2:
+            results = self._root_results if depth == 1 else self._suite_results
+            if "failure" in result_tags:
+                results[0] += 1
+            elif "error" in result_tags:
+                results[1] += 1
+        if elem is None:
+            return
+        if depth == 1 or not result_tags & FAILURE_TAGS:
+            self._amount_to_exclude += self._check_testcase(TestCase.fromelem(elem))
+        elif not self._has_root_testcases:
+            self._pending_testcases.append(TestCase.fromelem(elem))
+
+
+class _TagTarget:
+    """Target of an XML parser that passes the name and attributes of each element on, without building elements"""
+
+    def __init__(self, start, end):
+        self.start = start
+        self.end = end
+
+    def close(self):
+        pass
@@ -0,0 +1,395 @@
+# SPDX-License-Identifier: Apache-2.0
+
+import codecs
+import copy
+import io
+import locale
+import logging
+import mmap
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+
+from .archives import is_plain_logfile, iter_logfile_contents, open_logfile_part
+from .regex_checker import RegexChecker, RegexScanner, is_plain_ascii
+from .robot_checker import RobotSuiteChecker
+
+PART_SIZE = 2 ** 26  # minimum amount of bytes of a part of a logfile that is parsed by a separate process
+GROW_PROBE_SIZE = 2 ** 16  # amount of bytes to read to find out whether a full block of shared memory must grow
+
+LogfilePart = namedtuple("LogfilePart", ["path", "size", "member", "start", "end"])
+
+_template = None
+_collector = None
+
+
+class RecordCollector(logging.Handler):
+    """Logging handler that stores log records, to emit them in the parent process"""
+
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+def iter_checkers(warnings):
+    """Yields the activated checkers of a WarningsPlugin and, right after each checker, its sub-checkers
+
+    Args:
+        warnings (WarningsPlugin): The plugin with activated checkers
+
+    Yields:
+        WarningsChecker: Activated checker or sub-checker
+    """
+    yield from _iter_checkers(warnings.activated_checkers.values())
+
+
+def _iter_checkers(checkers):
+    """Yields the given checkers and, right after each checker, its sub-checkers"""
+    for checker in checkers:
+        yield checker
+        sub_checkers = getattr(checker, "checkers", [])
+        if isinstance(sub_checkers, dict):
+            sub_checkers = sub_checkers.values()
+        yield from _iter_checkers(sub_checkers)
+
+
+def split_logfiles(warnings, files, jobs):
+    """Splits large logfiles into parts that can be parsed in parallel, if only regex checkers are activated
+
+    A part ends at the start of a line that no warning can span: a line in the middle of ``match_span_lines`` lines
+    with text before it and as many lines with text from it on, after preprocessing, that contain none of the
+    ``literals`` of the activated checkers. Since every warning contains one of these literals and spans at most
+    ``match_span_lines`` lines with text, the warnings found in the parts are the same as those in the whole logfile.
+
+    Args:
+        warnings (WarningsPlugin): The plugin with activated checkers
+        files (list[Logfile]): Path, size and member pattern of the logfiles to parse
+        jobs (int): Maximum amount of processes
+
+    Returns:
+        list[Logfile/LogfilePart]: The logfiles, of which the large ones are replaced by their parts
+    """
+    checkers = list(warnings.activated_checkers.values())
+    if jobs < 2 or not checkers or not all(isinstance(checker, RegexChecker) and checker.literals
+                                           for checker in checkers):
+        return files
+    literals = {literal for checker in checkers for literal in checker.literals}
+    result = []
+    for logfile in files:
+        amount = min(jobs, logfile.size // PART_SIZE)
+        if amount < 2 or logfile.member is not None or not is_plain_logfile(logfile.path):
+            result.append(logfile)
+            continue
+        with open(logfile.path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            boundaries = [0]
+            for index in range(1, amount):
+                boundary = _find_part_boundary(buffer, max(boundaries[-1], logfile.size * index // amount),
+                                               logfile.size * (index + 1) // amount, literals, warnings.preprocessor)
+                if boundary is not None:
+                    boundaries.append(boundary)
+            boundaries.append(len(buffer))
+        result.extend(LogfilePart(logfile.path, end - start, None, start, end)
+                      for start, end in zip(boundaries, boundaries[1:]))
+    return result
+
+
+def _find_part_boundary(buffer, pos, end, literals, preprocessor):
+    """Finds the start of a line that no warning can span, see :func:`split_logfiles`
+
+    Args:
+        buffer (mmap.mmap): Content of the logfile
+        pos (int): Offset from which to search
+        end (int): Offset up to which to search
+        literals (set[str]): Strings of which each warning contains at least one
+        preprocessor (Preprocessor): Cleans up each line before it is checked
+
+    Returns:
+        int/None: Offset of the start of the line; None if no such line has been found
+    """
+    span = RegexChecker.match_span_lines
+    encoding = locale.getpreferredencoding(False)
+    if "\n".encode(encoding) != b"\n":
+        return None
+    starts = []  # start of each consecutive line with text that contains no literal
+    line_start = buffer.find(b"\n", pos, end) + 1
+    while line_start and (line_end := buffer.find(b"\n", line_start, end) + 1):
+        line = preprocessor(buffer[line_start:line_end].decode(encoding, "replace").replace("\r\n", "\n"))
+        if "\r" in line or any(literal in line for literal in literals):
+            starts = []  # a carriage return is a line ending in text mode
+        elif not line.isspace():
+            starts.append(line_start)
+            if len(starts) == 2 * span:
+                return starts[span]
+        line_start = line_end
+    return None
+
+
+def check_files(warnings, files, jobs):
+    """Parses logfiles, or parts of them, in a pool of processes
+
+    Each process parses a file with its own copy of the activated checkers. The results of these copies and their
+    log records are merged into the activated checkers in the order of the given files, so that the outcome is
+    identical to parsing the files one by one.
+
+    Args:
+        warnings (WarningsPlugin): Object for warnings where errors should be logged
+        files (list[Logfile/LogfilePart]): Path, size and member pattern of the logfiles, or parts of them, to parse
+        jobs (int): Maximum amount of processes
+
+    Returns:
+        list[Logfile]: The archives of which no member matches the member pattern
+    """
+    checkers = list(iter_checkers(warnings))
+    levels = {checker.logger.logger.name: checker.logger.logger.level for checker in checkers}
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(warnings, levels)) as executor:
+        # the largest files are submitted first to balance the work over the processes
+        futures = [None] * len(files)
+        for index in sorted(range(len(files)), key=lambda index: files[index].size, reverse=True):
+            futures[index] = executor.submit(_check_file, files[index])
+        unmatched = []
+        for logfile, future in zip(files, futures):
+            results, records, amount = future.result()
+            if not amount and logfile.member is not None:
+                unmatched.append(logfile)
+            _merge_results(checkers, results, records)
+            if warnings.fail_fast and warnings.is_outcome_fixed():
+                for future in futures:
+                    future.cancel()
+                break
+    return unmatched
+
+
+def check_file_per_checker(warnings, logfile, jobs):
+    """Parses a logfile, or each member of an archive, with each activated checker in its own process
+
+    The content is decompressed once and put in a block of shared memory, which each process reads without it being
+    sent to the process. Regex checkers search plain ASCII content in the shared memory itself; other content is
+    decoded by each process. Only the results of the checkers and their log records are sent back. They are merged
+    into the activated checkers in the order of these checkers.
+
+    Args:
+        warnings (WarningsPlugin): Object for warnings where errors should be logged
+        logfile (Logfile): Path, size and member pattern of the logfile to parse
+        jobs (int): Maximum amount of processes
+
+    Returns:
+        int: Number of parsed files
+    """
+    names = list(warnings.activated_checkers)
+    regex_checkers = any(isinstance(checker, RegexChecker) for checker in warnings.activated_checkers.values())
+    levels = {checker.logger.logger.name: checker.logger.logger.level for checker in iter_checkers(warnings)}
+    amount = 0
+    with ProcessPoolExecutor(max_workers=min(jobs, len(names)), initializer=_init_worker,
+                             initargs=(warnings, levels)) as executor:
+        for file in iter_logfile_contents(logfile.path, logfile.member):
+            # the size of a plain file is known; the block grows for decompressed content
+            shared, size = read_shared_content(file, logfile.size)
+            try:
+                plain_ascii = regex_checkers and codecs.lookup(file.encoding).name in ("ascii", "utf-8")
+                if plain_ascii:
+                    with shared.buf[:size] as view:
+                        plain_ascii = is_plain_ascii(view)
+                futures = [executor.submit(_check_shared_content, name, shared.name, size, file.encoding, file.errors,
+                                           plain_ascii)
+                           for name in names]
+                for name, future in zip(names, futures):
+                    results, records = future.result()
+                    _merge_results(list(_iter_checkers([warnings.activated_checkers[name]])), results, records)
+            finally:
+                shared.close()
+                shared.unlink()
+            amount += 1
+            if warnings.fail_fast and warnings.is_outcome_fixed():
+                break
+    return amount
+
+
+def read_shared_content(file, size):
+    """Reads the binary content of a text file into a new block of shared memory, without copying it in between
+
+    Args:
+        file (_io.TextIOWrapper): The open file, of which the underlying binary file is read
+        size (int): The expected amount of bytes, e.g. the size of a plain file; the block grows when the content is
+            larger, e.g. when it is decompressed while it is read
+
+    Returns:
+        SharedMemory: The block of shared memory, which is to be closed and unlinked by the caller
+        int: Amount of bytes of the content at the start of the block
+    """
+    shared = SharedMemory(create=True, size=max(size, 1))
+    size = 0
+    try:
+        while True:
+            if size < shared.size:
+                with shared.buf[size:] as view:
+                    amount = file.buffer.readinto(view)
+                if not amount:
+                    return shared, size
+                size += amount
+                continue
+            data = file.buffer.read(GROW_PROBE_SIZE)  # whether the content is larger than the block
+            if not data:
+                return shared, size
+            grown = SharedMemory(create=True, size=2 * (size + len(data)))
+            grown.buf[:size] = shared.buf[:size]
+            grown.buf[size:size + len(data)] = data
+            size += len(data)
+            shared.close()
+            shared.unlink()
+            shared = grown
+    except BaseException:
+        shared.close()
+        shared.unlink()
+        raise
+
+
+def _merge_results(checkers, results, records):
+    """Merges the results of copies of checkers and handles their log records in the parent process
+
+    Args:
+        checkers (list[WarningsChecker]): The checkers and their sub-checkers, in the order of :func:`iter_checkers`
+        results (list[WarningsChecker]): The copies of these checkers, which hold the results
+        records (list[logging.LogRecord]): The log records, with the index of the (sub-)checker as ``checker``
+    """
+    # the checkers log while parsing, interleaved when they search the same chunk, so the records are handled in the
+    # order in which they have been logged; the results are merged afterwards, like they are verified after parsing
+    for record in records:
+        record.checker = checkers[record.checker]
+        logging.getLogger(record.name).handle(record)
+    for checker, result in zip(checkers, results):
+        checker.merge(result)
+
+
+def _init_worker(warnings, levels):
+    """Stores the plugin to copy for each file and redirects the log records of all checkers to a collector
+
+    Args:
+        warnings (WarningsPlugin): The plugin with activated checkers that have not parsed any content yet
+        levels (dict): Level for each logger of a checker by name
+    """
+    global _template, _collector
+    _template = warnings
+    _collector = RecordCollector()
+    for name, level in levels.items():
+        logger = logging.getLogger(name)
+        logger.setLevel(level)
+        logger.handlers = [_collector]
+        logger.propagate = False
+
+
+def _check_file(logfile):
+    """Parses a single logfile, a part of it, or the members of an archive, with a fresh copy of the activated checkers
+
+    Args:
+        logfile (Logfile/LogfilePart): Path and member pattern of the logfile, or the part of the logfile, to parse
+
+    Returns:
+        list[WarningsChecker]: The copies of the activated checkers and their sub-checkers, which hold the results
+        list[logging.LogRecord]: The log records, with the index of the (sub-)checker as ``checker`` attribute
+        int: Number of parsed files
+    """
+    warnings, checkers = _copy_template()
+    if isinstance(logfile, LogfilePart):
+        with open_logfile_part(logfile.path, logfile.start, logfile.end) as file:
+            warnings.check_logfile(file)
+        amount = 1
+    else:
+        amount = warnings.check_path(logfile.path, logfile.member)
+    return checkers, _collect_records(checkers), amount
+
+
+def _check_shared_content(name, shared_name, size, encoding, errors, plain_ascii=False):
+    """Parses content in shared memory with a fresh copy of a single activated checker
+
+    A regex checker searches plain ASCII content in the shared memory itself, with :meth:`RegexScanner.check_buffer`,
+    unless the preprocessor changes plain text. Other checkers, and a regex checker in all other cases, read the
+    content through a text stream, which copies and decodes it chunk by chunk.
+
+    Args:
+        name (str): Name of the activated checker
+        shared_name (str): Name of the block of shared memory
+        size (int): Amount of bytes of the content at the start of the block
+        encoding (str): Encoding of the content
+        errors (str): How to handle decoding errors
+        plain_ascii (bool): True if the content is ASCII text that can be parsed without decoding it
+
+    Returns:
+        list[WarningsChecker]: The copy of the checker and its sub-checkers, which hold the results
+        list[logging.LogRecord]: The log records, with the index of the (sub-)checker as ``checker`` attribute
+    """
+    warnings, checkers = _copy_template(name)
+    checker = warnings.activated_checkers[name]
+    shared = SharedMemory(shared_name)
+    try:
+        if plain_ascii and isinstance(checker, RegexChecker) and not warnings.preprocessor.changes_plain_text:
+            with shared.buf[:size] as buffer:
+                RegexScanner([checker], warnings.preprocessor).check_buffer(buffer)
+        else:
+            with io.TextIOWrapper(io.BufferedReader(_BufferReader(shared.buf[:size])), encoding=encoding,
+                                  errors=errors) as file:
+                warnings.check_logfile(file)
+    finally:
+        shared.close()
+    return checkers, _collect_records(checkers)
+
+
+def _copy_template(name=None):
+    """Creates a fresh copy of the stored plugin to parse content with
+
+    Args:
+        name (str/None): Name of the only activated checker to keep; None to keep all activated checkers
+
+    Returns:
+        WarningsPlugin: The copy of the plugin
+        list[WarningsChecker]: Its activated checkers and their sub-checkers
+    """
+    warnings = copy.deepcopy(_template)
+    if name is not None:
+        warnings.activated_checkers = {name: warnings.activated_checkers[name]}
+    checkers = list(iter_checkers(warnings))
+    for checker in checkers:
+        if isinstance(checker, RobotSuiteChecker):
+            checker.check_suite_name = False  # verified when merging the results
+    _collector.records = []
+    return warnings, checkers
+
+
+def _collect_records(checkers):
+    """Returns the collected log records, of which the checker is replaced by its index so that they can be pickled
+
+    Args:
+        checkers (list[WarningsChecker]): The checkers and their sub-checkers that have logged the records
+
+    Returns:
+        list[logging.LogRecord]: The log records, with the index of the (sub-)checker as ``checker`` attribute
+    """
+    indexes = {id(checker): index for index, checker in enumerate(checkers)}
+    records = _collector.records
+    for record in records:
+        record.checker = indexes[id(record.checker)]
+    return records
+
+
+class _BufferReader(io.RawIOBase):
+    """Unseekable raw stream that reads a buffer, e.g. a view of shared memory, which is released when it is closed"""
+
+    def __init__(self, buffer):
+        super().__init__()
+        self._buffer = buffer
+        self._pos = 0
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        size = min(len(buffer), len(self._buffer) - self._pos)
+        buffer[:size] = self._buffer[self._pos:self._pos + size]
+        self._pos += size
+        return size
+
+    def close(self):
+        self._buffer.release()
+        super().close()
@@ -0,0 +1,199 @@
+# SPDX-License-Identifier: Apache-2.0
+
+import re
+
+from .regex_engines import RegexEngine
+
+DEFAULT_FLAGS = re.compile("").flags
+LITERAL_CHAR_REGEX = re.compile(r"[^.^$*+?{}\[\]\\|()]|\\[^\w\s]")
+QUANTIFIERS = ("*", "+", "?", "{")
+# Backreferences and conditionals refer to group numbers or names, which change when regexes are combined, and
+# comments in verbose mode can contain any character
+UNCOMBINABLE_REGEX = re.compile(r"\\[1-9]|\(\?P=|\(\?\(|\(\?[-aiLmsu]*x")
+
+
+class PatternList:
+    """Ordered collection of compiled regexes that is searched with a single combined pattern
+
+    The literal prefix of each regex, e.g. ``src/`` of ``src/.*\\.h``, is put in a trie: a nested alternation in which
+    regexes with a common prefix share a single branch. The remainder of each regex follows its prefix, followed by an
+    empty named group that tells which regex has matched. Regexes without literal prefix are alternatives of the trie.
+    This way, the cost of a search barely grows with the number of regexes that have a literal prefix. To report the
+    first regex in order that matches, only the regexes before the one that has matched are searched once more.
+    Regexes with flags, named groups, backreferences or conditionals cannot be combined; they are searched one by one,
+    just like the regexes that have been compiled by another engine than the one of the collection.
+    """
+
+    def __init__(self, patterns=(), engine=None):
+        """Constructor
+
+        Args:
+            patterns (iterable[re.Pattern]): The initial patterns
+            engine (RegexEngine/None): Engine that compiles the combined pattern; None for Python's ``re`` module
+        """
+        self._patterns = list(patterns)
+        self._engine = RegexEngine() if engine is None else engine
+        self._compiled = False
+        self._combined = None
+        self._separate = []
+
+    def __iter__(self):
+        return iter(self._patterns)
+
+    def __len__(self):
+        return len(self._patterns)
+
+    def __getstate__(self):
+        return {"_patterns": self._patterns, "_engine": self._engine}
+
+    def __setstate__(self, state):
+        self.__init__(state["_patterns"], state["_engine"])
+
+    @property
+    def engine(self):
+        """RegexEngine: Engine that compiles the combined pattern"""
+        return self._engine
+
+    @engine.setter
+    def engine(self, engine):
+        self._engine = engine
+        self._compiled = False
+
+    def append(self, pattern):
+        """Adds a pattern
+
+        Args:
+            pattern (re.Pattern): The compiled regex
+        """
+        self._patterns.append(pattern)
+        self._compiled = False
+
+    def search(self, content):
+        """Searches the content for any of the patterns
+
+        Args:
+            content (str): The content to search
+
+        Returns:
+            str/None: The regex of the first pattern in order that matches; None if no pattern matches
+        """
+        if not self._compiled:
+            self._compile()
+        match = self._combined.search(content) if self._combined is not None else None
+        if match is None:
+            return self._search_each(self._separate, content)
+        # The marker group of the earliest match tells which pattern has matched; a pattern before it in order can still
+        # match further on in the content
+        index = min(int(name[1:]) for name, value in match.groupdict().items() if value is not None)
+        regex = self._search_each(self._patterns[:index], content)
+        return self._patterns[index].pattern if regex is None else regex
+
+    @staticmethod
+    def _search_each(patterns, content):
+        """Searches the content for each of the patterns one by one
+
+        Args:
+            patterns (list[re.Pattern]): The patterns, in order
+            content (str): The content to search
+
+        Returns:
+            str/None: The regex of the first pattern that matches; None if no pattern matches
+        """
+        for pattern in patterns:
+            if pattern.search(content):
+                return pattern.pattern
+        return None
+
+    def _compile(self):
+        """Combines the patterns into a single pattern, except the ones that need to be searched separately"""
+        self._separate = []
+        trie = {}
+        alternatives = []
+        for index, pattern in enumerate(self._patterns):
+            if not (self._engine.is_native(pattern) and _is_combinable(pattern)):
+                self._separate.append(pattern)
+                continue
+            literal, remainder = _split_literal_prefix(pattern.pattern)
+            branch = f"(?:{remainder})(?P<p{index}>)"
+            if literal:
+                node = trie
+                for char in literal:
+                    node = node.setdefault(char, {})
+                node.setdefault("", []).append(branch)
+            else:
+                alternatives.append(branch)
+        if trie:
+            alternatives.insert(0, _node_regex(trie))
+        try:
+            self._combined = self._engine.compile("|".join(alternatives)) if alternatives else None
+        except re.error:
+            self._combined = None
+            self._separate = list(self._patterns)
+        self._compiled = True
+
+
+def _is_combinable(pattern):
+    """Checks whether a compiled regex keeps its meaning as part of a combined pattern"""
+    if not isinstance(pattern.pattern, str) or getattr(pattern, "flags", DEFAULT_FLAGS) != DEFAULT_FLAGS:
+        return False
+    return not pattern.groupindex and not UNCOMBINABLE_REGEX.search(pattern.pattern)
+
+
+def _split_literal_prefix(regex):
+    """Splits a regex into the literal string that each match starts with and the remainder of the regex
+
+    Args:
+        regex (str): The regex
+
+    Returns:
+        str: The literal prefix, which is empty when the regex has an alternation outside of groups
+        str: The remainder of the regex
+    """
+    if _has_top_level_alternation(regex):
+        return "", regex
+    chars = []
+    pos = 0
+    while (match := LITERAL_CHAR_REGEX.match(regex, pos)) and not regex.startswith(QUANTIFIERS, match.end()):
+        chars.append(match.group()[-1])
+        pos = match.end()
+    return "".join(chars), regex[pos:]
+
+
+def _has_top_level_alternation(regex):
+    """Checks whether a regex contains a ``|`` that is not inside a group or a character set"""
+    depth = 0
+    pos = 0
+    while pos < len(regex):
+        char = regex[pos]
+        if char == "\\":
+            pos += 1
+        elif char == "[":
+            pos += 1
+            if regex.startswith("^", pos):
+                pos += 1
+            if regex.startswith("]", pos):
+                pos += 1  # a closing bracket right at the start is part of the set
+            while pos < len(regex) and regex[pos] != "]":
+                pos += 2 if regex[pos] == "\\" else 1
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "|" and not depth:
+            return True
+        pos += 1
+    return False
+
+
+def _node_regex(node):
+    """Creates a regex for a node of a trie, which matches the remainders of the regexes below the node
+
+    Args:
+        node (dict): Child node for each next character of the literal prefixes, and the branches of the regexes of
+            which the literal prefix ends at this node for the key ``""``
+
+    Returns:
+        str: The regex
+    """
+    alternatives = node.get("", []) + [re.escape(char) + _node_regex(child) for char, child in node.items() if char]
+    return alternatives[0] if len(alternatives) == 1 else f"(?:{'|'.join(alternatives)})"
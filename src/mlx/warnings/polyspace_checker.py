@@ -6,6 +6,7 @@ from io import TextIOWrapper
 from string import Template
 
 from .code_quality import Finding
+from .compression import decompress
 from .exceptions import WarningsConfigError
 from .warnings_checker import WarningsChecker
 
@@ -71,6 +72,8 @@ class PolyspaceChecker(WarningsChecker):
         """
         Function for counting the number of failures in a TSV file exported by Polyspace
 
+        The file is decompressed while it is read if it is compressed with gzip, bzip2 or xz.
+
         Args:
             content (_io.TextIOWrapper): The open file to parse
         """
@@ -78,7 +81,7 @@ class PolyspaceChecker(WarningsChecker):
             raise TypeError(
                 f"{self.__class__.__name__} can't handle this type; expected {type(TextIOWrapper)}; got {type(content)}"
             )
-        reader = csv.DictReader(content, dialect="excel-tab")
+        reader = csv.DictReader(decompress(content, newline=""), dialect="excel-tab")
         # set column names to lowercase
         reader.fieldnames = [name.lower() for name in reader.fieldnames]
 
@@ -98,6 +101,22 @@ class PolyspaceChecker(WarningsChecker):
             self.count += checker.return_count()
         return self.count
 
+    def is_maximum_exceeded(self):
+        """Function for checking whether the warning count of a sub-checker already exceeds its configured maximum
+
+        Returns:
+            bool: True if a sub-checker has found more warnings than its maximum limit allows
+        """
+        return any(checker.is_maximum_exceeded() for checker in self.checkers)
+
+    def is_outcome_fixed(self):
+        """Function for checking whether parsing more content can no longer change the outcome of any sub-checker
+
+        Returns:
+            bool: True if the maximum limit of each sub-checker is exceeded already
+        """
+        return all(checker.is_outcome_fixed() for checker in self.checkers)
+
     def return_check_limits(self):
         """Function for checking whether the warning count is within the configured limits
 
@@ -0,0 +1,67 @@
+# SPDX-License-Identifier: Apache-2.0
+
+import re
+
+ANSI_ESCAPE_REGEX = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+# Prefix of each line of a GitLab CI job log with timestamps, e.g. ``2024-05-22T12:43:46.962646Z 00O ``, or of a
+# Jenkins console log with the Timestamper plugin, e.g. ``[2024-05-22T12:43:46.962Z] `` or ``[12:43:46] ``
+TIMESTAMP_PREFIX_REGEX = re.compile(r"(?m)^(?:\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d(?:\.\d+)?Z \d\d[OE]\+?"
+                                    r"|\[(?:\d{4}-\d\d-\d\dT)?\d\d:\d\d:\d\d(?:\.\d+)?(?:Z|[+-]\d\d:?\d\d)?\]) ?")
+
+
+class Preprocessor:
+    """Cleans up content once, before the regex checkers search it for warnings
+
+    Content is only copied when it needs to be cleaned up: ANSI escape sequences are only removed when the content
+    contains an escape character, and lines are only checked for their length when the content is longer than the
+    maximum line length.
+    """
+
+    def __init__(self, strip_ansi=True, strip_timestamps=False, max_line_length=None):
+        """Constructor
+
+        Args:
+            strip_ansi (bool): Remove ANSI escape sequences, e.g. colors
+            strip_timestamps (bool): Remove the timestamp that GitLab CI or Jenkins prepends to each line
+            max_line_length (int/None): Maximum amount of characters of a line; longer lines, e.g. minified output,
+                are emptied before they get cleaned up, so that they are not searched for warnings. None to search
+                all lines.
+        """
+        self.strip_ansi = strip_ansi
+        self.strip_timestamps = strip_timestamps
+        self.max_line_length = max_line_length
+
+    @property
+    def changes_plain_text(self):
+        """bool: True if content without escape characters can get changed too"""
+        return self.strip_timestamps or self.max_line_length is not None
+
+    def __call__(self, content):
+        """Cleans up the content
+
+        Args:
+            content (str): Complete lines of the content to parse, starting at the start of a line
+
+        Returns:
+            str: The content to search for warnings
+        """
+        if self.max_line_length is not None and len(content) > self.max_line_length:
+            content = "\n".join(line if len(line) <= self.max_line_length else "" for line in content.split("\n"))
+        if self.strip_ansi and "\x1b" in content:
+            content = ANSI_ESCAPE_REGEX.sub("", content)
+        if self.strip_timestamps:
+            content = TIMESTAMP_PREFIX_REGEX.sub("", content)
+        return content
+
+    def limit_partial_line(self, line):
+        """Shortens an incomplete line that is too long to be searched, so that it doesn't keep growing in memory
+
+        Args:
+            line (str): Start of a line of which the end has not been read yet
+
+        Returns:
+            str: The given line, or its first characters, which are still more than the maximum line length
+        """
+        if self.max_line_length is not None and len(line) > self.max_line_length:
+            return line[:self.max_line_length + 1]
+        return line
@@ -1,29 +1,225 @@
+import logging
 import os
 import re
 from string import Template
 
 from .code_quality import Finding
 from .exceptions import WarningsConfigError
+from .preprocessing import Preprocessor
 from .warnings_checker import WarningsChecker
 
-DOXYGEN_WARNING_REGEX = r"(?:(?P<path1>(?:[/.]|[A-Za-z]).+?):(?P<line1>-?\d+):\s*(?P<severity1>[Ww]arning|[Ee]rror)|<.+>:(?P<line2>-?\d+)(?::\s*(?P<severity2>[Ww]arning|[Ee]rror))?): (?P<description1>.+(?:(?!\s*([Nn]otice|[Ww]arning|[Ee]rror): )[^/<\n][^:\n][^/\n].+)*)|\s*\b(?P<severity3>[Nn]otice|[Ww]arning|[Ee]rror): (?!notes)(?P<description2>.+)\n?"
+# The Doxygen regex has three alternatives: a warning with a path, one with a tag and a bare one. Each alternative
+# consists of a part that depends on where the match starts and a tail that doesn't, see DoxygenPattern.
+DOXYGEN_DESCRIPTION_REGEX = r": (?P<description1>.+(?:(?!\s*([Nn]otice|[Ww]arning|[Ee]rror): )[^/<\n][^:\n][^/\n].+)*)"
+DOXYGEN_PATH_TAIL_REGEX = r":(?P<line1>-?\d+):\s*(?P<severity1>[Ww]arning|[Ee]rror)"
+DOXYGEN_PATH_WARNING_REGEX = rf"(?P<path1>(?:[/.]|[A-Za-z]).+?){DOXYGEN_PATH_TAIL_REGEX}"
+DOXYGEN_TAG_TAIL_REGEX = r">:(?P<line2>-?\d+)(?::\s*(?P<severity2>[Ww]arning|[Ee]rror))?"
+DOXYGEN_TAG_WARNING_REGEX = rf"<.+{DOXYGEN_TAG_TAIL_REGEX}"
+DOXYGEN_BARE_TAIL_REGEX = r"\b(?P<severity3>[Nn]otice|[Ww]arning|[Ee]rror): (?!notes)(?P<description2>.+)\n?"
+DOXYGEN_BARE_WARNING_REGEX = rf"\s*{DOXYGEN_BARE_TAIL_REGEX}"
+DOXYGEN_WARNING_REGEX = (f"(?:{DOXYGEN_PATH_WARNING_REGEX}|{DOXYGEN_TAG_WARNING_REGEX}){DOXYGEN_DESCRIPTION_REGEX}"
+                         f"|{DOXYGEN_BARE_WARNING_REGEX}")
 doxy_pattern = re.compile(DOXYGEN_WARNING_REGEX)
+doxy_bytes_pattern = re.compile(DOXYGEN_WARNING_REGEX.encode())
 
 SPHINX_WARNING_REGEX = r"(?m)^(?:((?P<path1>.+?):(?P<line1>\d+|None)?):?\s*)?(?P<severity1>DEBUG|INFO|WARNING|ERROR|SEVERE|CRITICAL):\s*(?P<description1>.+)$"
 sphinx_pattern = re.compile(SPHINX_WARNING_REGEX)
+sphinx_bytes_pattern = re.compile(SPHINX_WARNING_REGEX.encode())
 
 PYTHON_XMLRUNNER_REGEX = r"(\s*(?P<severity1>ERROR|FAILED) (\[\d+\.\d{3}s\]: \s*(?P<description1>.+)))\n?"
 xmlrunner_pattern = re.compile(PYTHON_XMLRUNNER_REGEX)
+xmlrunner_bytes_pattern = re.compile(PYTHON_XMLRUNNER_REGEX.encode())
 
 COVERITY_WARNING_REGEX = r"(?P<path>[\w\.\\/\- ]+)(:(?P<line>\d+)(:(?P<column>\d+))?)?: ?CID (?P<cid>\d+) \(#(?P<curr>\d+) of (?P<max>\d+)\): (?P<checker>.+): (?P<classification>[\w ]+),.+"
 coverity_pattern = re.compile(COVERITY_WARNING_REGEX)
+coverity_bytes_pattern = re.compile(COVERITY_WARNING_REGEX.encode())
+
+# Each match of a warning regex contains at least one of the corresponding literals
+DOXYGEN_LITERALS = ("arning", "rror", "otice", ">:")
+SPHINX_LITERALS = ("DEBUG:", "INFO:", "WARNING:", "ERROR:", "SEVERE:", "CRITICAL:", "Warning:")
+PYTHON_XMLRUNNER_LITERALS = ("ERROR [", "FAILED [")
+COVERITY_LITERALS = ("CID ",)
+# Bytes that are decoded or matched differently in text mode than in binary mode
+UNSUPPORTED_ASCII_BYTES = (b"\x00", b"\r", b"\x1b", b"\x1c", b"\x1d", b"\x1e", b"\x1f")
+
+
+def is_plain_ascii(buffer, chunk_size=2 ** 20):
+    """Checks whether a buffer consists of ASCII text that can be parsed without decoding it
+
+    Args:
+        buffer (bytes/mmap.mmap/memoryview): The buffer
+        chunk_size (int): Amount of bytes to inspect at once
+
+    Returns:
+        bool: True if all bytes are ASCII and none of them is decoded or matched differently in text mode
+    """
+    for start in range(0, len(buffer), chunk_size):
+        chunk = bytes(buffer[start:start + chunk_size])
+        if not chunk.isascii() or any(byte in chunk for byte in UNSUPPORTED_ASCII_BYTES):
+            return False
+    return True
+
+
+def _find_tail_start(content, amount, end=None, newline="\n"):
+    """Finds the start of the last lines of the content, so that these lines contain a given amount of lines with text
+
+    Args:
+        content (str/bytes): Content that consists of complete lines
+        amount (int): Amount of lines with text (i.e. not only whitespace) that the tail should contain
+        end (int/None): Index of the start of a line to regard as the end of the content
+        newline (str/bytes): The newline character, which depends on the type of the content
+
+    Returns:
+        int: Index of the first character of the tail
+    """
+    pos = len(content) if end is None else end
+    while amount and pos:
+        start = content.rfind(newline, 0, pos - 1) + 1
+        if not content[start:pos].isspace():
+            amount -= 1
+        pos = start
+    return pos
+
+
+def _find_head_end(content, amount, start, newline="\n", size=None):
+    """Finds the end of the first lines of the content after a given index, so that these lines contain a given amount
+    of lines with text
+
+    Args:
+        content (str/bytes): The content
+        amount (int): Amount of lines with text (i.e. not only whitespace) that the head should contain
+        start (int): Index of the start of the line where the head starts
+        newline (str/bytes): The newline character, which depends on the type of the content
+        size (int/None): Amount of characters at the start of the content to regard; None for the whole content
+
+    Returns:
+        int: Index right after the last character of the head
+    """
+    size = len(content) if size is None else size
+    pos = start
+    while amount and pos < size:
+        end = content.find(newline, pos, size) + 1 or size
+        if not content[pos:end].isspace():
+            amount -= 1
+        pos = end
+    return pos
+
+
+class DoxygenPattern:
+    """Searches for the same matches as ``doxy_pattern``, in linear instead of quadratic time
+
+    At each position of a line without warning, ``doxy_pattern`` tries each of its alternatives, which scan up to the
+    end of the line, e.g. for the ``:12: warning: ...`` tail of a warning with a path. Whether an alternative matches
+    only depends on where its tail matches, though. Each alternative is therefore found by searching its tail first and
+    then the first position in the line where the alternative can start. Matching the alternative at that position
+    results in the same match object as ``doxy_pattern``.
+    """
+
+    def __init__(self, bytes_pattern=False):
+        """Constructor
 
-ANSI_ESCAPE_REGEX = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+        Args:
+            bytes_pattern (bool): Search bytes instead of strings
+        """
+        def compile_(regex):
+            return re.compile(regex.encode() if bytes_pattern else regex)
+
+        self.pattern = doxy_bytes_pattern.pattern if bytes_pattern else doxy_pattern.pattern
+        # The other alternatives fail right away with ``(?!)``, so that the groups are the same as in ``doxy_pattern``
+        self._path_warning = compile_(f"(?:{DOXYGEN_PATH_WARNING_REGEX}|(?!){DOXYGEN_TAG_WARNING_REGEX})"
+                                      f"{DOXYGEN_DESCRIPTION_REGEX}|(?!){DOXYGEN_BARE_WARNING_REGEX}")
+        self._path_tail = compile_(DOXYGEN_PATH_TAIL_REGEX + DOXYGEN_DESCRIPTION_REGEX)
+        self._path_start = compile_(r"[/.A-Za-z]")
+        self._tag_warning = compile_(f"(?:(?!){DOXYGEN_PATH_WARNING_REGEX}|{DOXYGEN_TAG_WARNING_REGEX})"
+                                     f"{DOXYGEN_DESCRIPTION_REGEX}|(?!){DOXYGEN_BARE_WARNING_REGEX}")
+        self._tag_tail = compile_(DOXYGEN_TAG_TAIL_REGEX + DOXYGEN_DESCRIPTION_REGEX)
+        self._bare_warning = compile_(f"(?:(?!){DOXYGEN_PATH_WARNING_REGEX}|(?!){DOXYGEN_TAG_WARNING_REGEX})"
+                                      f"{DOXYGEN_DESCRIPTION_REGEX}|{DOXYGEN_BARE_WARNING_REGEX}")
+        self._bare_tail = compile_(DOXYGEN_BARE_TAIL_REGEX)
+        self._newline = b"\n" if bytes_pattern else "\n"
+        self._tag_start = b"<" if bytes_pattern else "<"
+
+    def finditer(self, string, pos=0, endpos=None):
+        """Yields the matches like ``re.Pattern.finditer``
+
+        Args:
+            string (str/bytes/mmap.mmap): The content to search
+            pos (int): Index where the search starts
+            endpos (int/None): Index to regard as the end of the content
+
+        Yields:
+            re.Match: The next match
+        """
+        endpos = len(string) if endpos is None else min(endpos, len(string))
+        searches = (self._search_path_warning, self._search_tag_warning, self._search_bare_warning)
+        matches = [search(string, pos, endpos) for search in searches]
+        while any(matches):
+            match = min((match for match in matches if match), key=lambda match: match.start())
+            yield match
+            pos = match.end()
+            matches = [match if match is None or match.start() >= pos else search(string, pos, endpos)
+                       for match, search in zip(matches, searches)]
+
+    def _search_path_warning(self, string, pos, endpos):
+        """Searches the first warning with a path, e.g. ``file.c:12: warning: ...``"""
+        while (tail := self._path_tail.search(string, pos + 2, endpos)) is not None:
+            colon = tail.start()
+            line_start = string.rfind(self._newline, pos, colon) + 1 or pos
+            start = self._path_start.search(string, line_start, colon - 1)
+            if start is not None:
+                return self._path_warning.match(string, start.start(), endpos)
+            pos = colon - 1
+        return None
+
+    def _search_tag_warning(self, string, pos, endpos):
+        """Searches the first warning with a tag, e.g. ``<tag>:12: ...``"""
+        while (tail := self._tag_tail.search(string, pos + 2, endpos)) is not None:
+            bracket = tail.start()
+            line_start = string.rfind(self._newline, pos, bracket) + 1 or pos
+            start = string.find(self._tag_start, line_start, bracket - 1)
+            if start != -1:
+                return self._tag_warning.match(string, start, endpos)
+            pos = bracket - 1
+        return None
+
+    def _search_bare_warning(self, string, pos, endpos):
+        """Searches the first warning without path or tag, e.g. ``warning: ...``, including the preceding whitespace"""
+        tail = self._bare_tail.search(string, pos, endpos)
+        if tail is None:
+            return None
+        start = tail.start()
+        while start > pos and string[start - 1:start].isspace():
+            start -= 1
+        return self._bare_warning.match(string, start, endpos)
+
+
+class DecodedMatch:
+    """Match of a bytes pattern in ASCII text that returns its groups as strings
+
+    Only the requested groups get decoded.
+    """
+
+    def __init__(self, match):
+        self.match = match
+
+    def group(self, *groups):
+        result = self.match.group(*groups)
+        if isinstance(result, tuple):
+            return tuple(value if value is None else value.decode("ascii") for value in result)
+        return result if result is None else result.decode("ascii")
+
+    def groupdict(self):
+        return {name: value if value is None else value.decode("ascii")
+                for name, value in self.match.groupdict().items()}
 
 
 class RegexChecker(WarningsChecker):
     name = "regex"
     pattern = None
+    bytes_pattern = None
+    literals = ()  # strings of which each match of ``pattern`` contains at least one; empty to search everywhere
+    streaming = True
+    match_span_lines = 3  # maximum number of lines with text that a single match can span
     SEVERITY_MAP = {
         "debug": "info",
         "info": "info",
@@ -35,23 +231,79 @@ class RegexChecker(WarningsChecker):
         "failed": "critical",
     }
 
+    def __init__(self, *logging_args):
+        super().__init__(*logging_args)
+        self.preprocessor = Preprocessor()
+        self._scanner = None  # searches the chunks that are fed to the checker
+
+    @property
+    def regex_engine(self):
+        """RegexEngine: Engine that compiles the regexes of the checker, e.g. its pattern and those for exclusion"""
+        return self._regex_engine
+
+    @regex_engine.setter
+    def regex_engine(self, engine):
+        WarningsChecker.regex_engine.fset(self, engine)
+        for attribute in ("pattern", "bytes_pattern"):
+            pattern = getattr(self, attribute)
+            if pattern is not None and not isinstance(pattern, DoxygenPattern):  # already searches in linear time
+                setattr(self, attribute, engine.compile(pattern.pattern))
+
+    @property
+    def counts_only(self):
+        """bool: True if each match only needs to be counted, since it can't be excluded, logged or reported"""
+        return not (self.cq_enabled or len(self.exclude_patterns) or self.logger.isEnabledFor(logging.INFO))
+
     def check(self, content):
         """Function for counting the number of warnings in a specific text
 
         Args:
             content (str): The content to parse
         """
-        clean_content = ANSI_ESCAPE_REGEX.sub('', content)
-        matches = re.finditer(self.pattern, clean_content)
-        for match in matches:
-            match_string = match.group(0).strip()
-            if self._is_excluded(match_string):
-                continue
-            self.count += 1
-            self.logger.info(match_string)
-            self.logger.debug(match_string)
-            if self.cq_enabled:
-                self.add_code_quality_finding(match)
+        RegexScanner([self], self.preprocessor).check(content)
+
+    def check_buffer(self, buffer):
+        """Function for counting the number of warnings in a buffer, e.g. a memory-mapped file, without copying it
+
+        Args:
+            buffer (bytes/mmap.mmap/memoryview): ASCII text without ANSI escape sequences, carriage returns, NUL
+                characters and other whitespace characters that are specific to Unicode
+        """
+        RegexScanner([self], self.preprocessor).check_buffer(buffer)
+
+    def feed(self, chunk):
+        """Function for counting the number of warnings in the next chunk of a text
+
+        Only complete lines get parsed. Since a single warning can span multiple lines, the last lines that contain
+        text are carried over to the next chunk. Call :meth:`flush` after the last chunk.
+
+        Args:
+            chunk (str): The next chunk of the content to parse
+        """
+        if self._scanner is None:
+            self._scanner = RegexScanner([self], self.preprocessor)
+        self._scanner.feed(chunk)
+
+    def flush(self):
+        """Parses the lines that have been carried over by :meth:`feed`, including an incomplete last line"""
+        if self._scanner is not None:
+            self._scanner.flush()
+            self._scanner = None
+
+    def _check_match(self, match):
+        """Counts the match as a warning unless it is to be excluded
+
+        Args:
+            match (re.Match): The regex match
+        """
+        match_string = match.group(0).strip()
+        if self._is_excluded(match_string):
+            return
+        self.count += 1
+        self.logger.info(match_string)
+        self.logger.debug(match_string)
+        if self.cq_enabled:
+            self.add_code_quality_finding(match)
 
     def add_code_quality_finding(self, match):
         """Add code quality finding
@@ -78,6 +330,8 @@ class RegexChecker(WarningsChecker):
 class CoverityChecker(RegexChecker):
     name = "coverity"
     pattern = coverity_pattern
+    bytes_pattern = coverity_bytes_pattern
+    literals = COVERITY_LITERALS
 
     def __init__(self, *logging_args):
         super().__init__(*logging_args)
@@ -106,6 +360,22 @@ class CoverityChecker(RegexChecker):
     def cq_description_template(self, template_obj):
         self._cq_description_template = template_obj
 
+    @property
+    def counts_only(self):
+        """bool: False, since each match is passed to the sub-checker of its classification"""
+        return False
+
+    @property
+    def regex_engine(self):
+        """RegexEngine: Engine that compiles the regexes of the checker and of its sub-checkers"""
+        return self._regex_engine
+
+    @regex_engine.setter
+    def regex_engine(self, engine):
+        RegexChecker.regex_engine.fset(self, engine)
+        for checker in self.checkers.values():
+            checker.regex_engine = engine
+
     def return_count(self):
         """Getter function for the amount of warnings found
 
@@ -117,6 +387,22 @@ class CoverityChecker(RegexChecker):
             self.count += checker.return_count()
         return self.count
 
+    def is_maximum_exceeded(self):
+        """Function for checking whether the warning count of a sub-checker already exceeds its configured maximum
+
+        Returns:
+            bool: True if a sub-checker has found more warnings than its maximum limit allows
+        """
+        return any(checker.is_maximum_exceeded() for checker in self.checkers.values())
+
+    def is_outcome_fixed(self):
+        """Function for checking whether parsing more content can no longer change the outcome of any sub-checker
+
+        Returns:
+            bool: True if the maximum limit of each sub-checker is exceeded already
+        """
+        return all(checker.is_outcome_fixed() for checker in self.checkers.values())
+
     def return_check_limits(self):
         """Function for checking whether the warning count is within the configured limits
 
@@ -131,25 +417,21 @@ class CoverityChecker(RegexChecker):
             self.logger.warning(f"Returning error code {count}.")
         return count
 
-    def check(self, content):
-        """
-        Function for counting the number of warnings, but adopted for Coverity
-        output
+    def _check_match(self, match):
+        """Passes the match to the checker of its classification
 
         Args:
-            content (str): The content to parse
+            match (re.Match): The regex match
         """
-        matches = re.finditer(self.pattern, content)
-        for match in matches:
-            if (classification := match.group("classification").lower()) in self.checkers:
-                checker = self.checkers[classification]
-                checker.cq_enabled = self.cq_enabled
-                checker.exclude_patterns = self.exclude_patterns
-                checker.cq_description_template = self.cq_description_template
-                checker.cq_default_path = self.cq_default_path
-                checker.check(match)
-            else:
-                self.logger.warning(f"Unrecognized classification {match.group('classification')!r}")
+        if (classification := match.group("classification").lower()) in self.checkers:
+            checker = self.checkers[classification]
+            checker.cq_enabled = self.cq_enabled
+            checker.exclude_patterns = self.exclude_patterns
+            checker.cq_description_template = self.cq_description_template
+            checker.cq_default_path = self.cq_default_path
+            checker.check(match)
+        else:
+            self.logger.warning(f"Unrecognized classification {match.group('classification')!r}")
 
     def parse_config(self, config):
         """Process configuration
@@ -246,12 +528,16 @@ class CoverityClassificationChecker(WarningsChecker):
 
 class DoxyChecker(RegexChecker):
     name = "doxygen"
-    pattern = doxy_pattern
+    pattern = DoxygenPattern()
+    bytes_pattern = DoxygenPattern(bytes_pattern=True)
+    literals = DOXYGEN_LITERALS
 
 
 class SphinxChecker(RegexChecker):
     name = "sphinx"
     pattern = sphinx_pattern
+    bytes_pattern = sphinx_bytes_pattern
+    literals = SPHINX_LITERALS
     sphinx_deprecation_regex = r"(?m)^(?:(.+?:(?:\d+|None)?):?\s*)?(DEBUG|INFO|WARNING|ERROR|SEVERE|(?:\w+Sphinx\d+Warning)):\s*(.+)$"
     sphinx_deprecation_regex_in_match = "RemovedInSphinx\\d+Warning"
 
@@ -259,10 +545,194 @@ class SphinxChecker(RegexChecker):
         """
         Adds the pattern for sphinx_deprecation_regex to the list patterns to include and alters the main pattern
         """
-        self.pattern = re.compile(self.sphinx_deprecation_regex)
+        self.pattern = self.regex_engine.compile(self.sphinx_deprecation_regex)
+        self.bytes_pattern = self.regex_engine.compile(self.sphinx_deprecation_regex.encode())
         self.add_patterns([self.sphinx_deprecation_regex_in_match], self.include_patterns)
 
 
 class XMLRunnerChecker(RegexChecker):
     name = "xmlrunner"
     pattern = xmlrunner_pattern
+    bytes_pattern = xmlrunner_bytes_pattern
+    literals = PYTHON_XMLRUNNER_LITERALS
+
+
+class RegexScanner:
+    """Searches content for the warnings of multiple regex checkers, reading the content only once
+
+    The content is preprocessed once for all checkers. Fast substring searches for the ``literals`` of each checker
+    find the lines that can contain a warning; each literal is searched only once, even when multiple checkers declare
+    it. A checker then searches for its pattern only in the lines around these lines. Since every match contains a
+    literal of the checker and spans at most ``match_span_lines`` lines with text, the checkers find exactly the same
+    warnings as when searching the whole content.
+    """
+
+    def __init__(self, checkers, preprocessor=None):
+        """Constructor
+
+        Args:
+            checkers (list[RegexChecker]): The checkers to search warnings for
+            preprocessor (Preprocessor/None): Cleans up the content before it is searched; None for the default
+        """
+        self.checkers = checkers
+        self.preprocessor = Preprocessor() if preprocessor is None else preprocessor
+        self._partial_line = ""
+        self._carry = ""
+        self._positions = {checker: 0 for checker in checkers}
+
+    def check(self, content):
+        """Function for counting the number of warnings in a specific text
+
+        Args:
+            content (str): The content to parse
+        """
+        self.feed(content)
+        self.flush()
+
+    def check_buffer(self, buffer):
+        """Function for counting the number of warnings in a buffer, e.g. a memory-mapped file, without copying it
+
+        Args:
+            buffer (bytes/mmap.mmap/memoryview): ASCII text without ANSI escape sequences, carriage returns, NUL
+                characters and other whitespace characters that are specific to Unicode; a memoryview, e.g. of shared
+                memory, must start at the start of the bytes or mmap.mmap object that it refers to
+        """
+        size = len(buffer)
+        if isinstance(buffer, memoryview):
+            buffer = buffer.obj  # searched up to the end of the view, since a memoryview has no substring search
+        checkers = [checker for checker in self.checkers if not (checker.fail_fast and checker.is_outcome_fixed())]
+        regions = self._find_regions(buffer, checkers, bytes_patterns=True, size=size)
+        for checker in checkers:
+            self._search(checker, checker.bytes_pattern, buffer, regions[checker], 0, size, DecodedMatch)
+
+    def feed(self, chunk):
+        """Function for counting the number of warnings in the next chunk of a text
+
+        Only complete lines get parsed. Since a single warning can span multiple lines, the last lines that contain
+        text are carried over to the next chunk. Call :meth:`flush` after the last chunk.
+
+        Args:
+            chunk (str): The next chunk of the content to parse
+        """
+        content = self._partial_line + chunk
+        end = content.rfind("\n") + 1
+        self._partial_line = self.preprocessor.limit_partial_line(content[end:])
+        if not end:
+            return
+        content = self._carry + self.preprocessor(content[:end])
+        tail_start = _find_tail_start(content, RegexChecker.match_span_lines - 1)
+        self._scan(content, tail_start)
+        self._carry = content[tail_start:]
+
+    def flush(self):
+        """Parses the lines that have been carried over by :meth:`feed`, including an incomplete last line"""
+        content = self._carry + self.preprocessor(self._partial_line)
+        self._scan(content, len(content))
+        self._carry = ""
+        self._partial_line = ""
+
+    def _scan(self, content, stop):
+        """Searches the content for the warnings that start before a given index
+
+        Args:
+            content (str): The preprocessed content, starting with the lines that have been carried over
+            stop (int): Index from which the content gets carried over to the next search
+        """
+        checkers = [checker for checker in self.checkers if not (checker.fail_fast and checker.is_outcome_fixed())]
+        regions = self._find_regions(content, checkers)
+        for checker in checkers:
+            self._search(checker, checker.pattern, content, regions[checker], self._positions[checker], stop)
+            self._positions[checker] = max(self._positions[checker] - stop, 0)
+
+    def _search(self, checker, pattern, content, regions, pos, stop, match_type=None):
+        """Lets a checker check the matches of its pattern in the given regions of the content
+
+        Args:
+            checker (RegexChecker): The checker
+            pattern (re.Pattern): The pattern of the checker for the type of the content
+            content (str/bytes/mmap.mmap): The content
+            regions (list[tuple]): Start, end and end of the lookahead of each region to search in
+            pos (int): Index from which to search, to skip the matches that have been checked already
+            stop (int): Index from which no match is checked, since the content after it is incomplete
+            match_type (type/None): Class to wrap each match in before it is checked
+        """
+        counts_only = checker.counts_only
+        for start, end, endpos in regions:
+            if start >= stop:
+                break
+            end = min(end, stop)
+            for match in pattern.finditer(content, max(pos, start), endpos):
+                if match.start() >= end or (checker.fail_fast and checker.is_outcome_fixed()):
+                    break
+                if counts_only:
+                    checker.count += 1
+                else:
+                    checker._check_match(match if match_type is None else match_type(match))
+                pos = match.end()
+        self._positions[checker] = pos
+
+    @staticmethod
+    def _find_lines(content, literal, newline, size):
+        """Finds the lines that contain a literal with fast substring searches
+
+        Args:
+            content (str/bytes/mmap.mmap): The content
+            literal (str/bytes): The literal to search for, of the same type as the content
+            newline (str/bytes): The newline character, of the same type as the content
+            size (int): Amount of characters at the start of the content to search
+
+        Returns:
+            set[tuple]: Start and end of each line that contains the literal
+        """
+        lines = set()
+        pos = content.find(literal, 0, size)
+        while pos != -1:
+            line_start = content.rfind(newline, 0, pos) + 1
+            line_end = content.find(newline, pos + len(literal), size) + 1 or size
+            lines.add((line_start, line_end))
+            pos = content.find(literal, line_end, size)
+        return lines
+
+    def _find_regions(self, content, checkers, bytes_patterns=False, size=None):
+        """Finds the regions of the content that can contain a warning for each checker
+
+        A region spans the ``match_span_lines`` lines with text before and the ``match_span_lines - 1`` lines with
+        text after a line that contains one of the ``literals`` of the checker. Overlapping regions are merged. The
+        next line with text after a region can be looked at by lookahead assertions, but a match must start inside the
+        region. A checker without literals gets a single region that spans the whole content.
+
+        Args:
+            content (str/bytes/mmap.mmap): The content
+            checkers (list[RegexChecker]): The checkers
+            bytes_patterns (bool): True to search the content with bytes patterns
+            size (int/None): Amount of characters at the start of the content to search; None for the whole content
+
+        Returns:
+            dict: For each checker, a list with the start, the end and the end for lookahead of each region
+        """
+        size = len(content) if size is None else size
+        newline = b"\n" if bytes_patterns else "\n"
+        span = RegexChecker.match_span_lines
+        lines = {}
+        found = {}  # lines for each literal, which is searched only once when multiple checkers declare it
+        for checker in checkers:
+            if not checker.literals:
+                continue
+            lines[checker] = set()
+            for literal in checker.literals:
+                if literal not in found:
+                    found[literal] = self._find_lines(content, literal.encode() if bytes_patterns else literal,
+                                                      newline, size)
+                lines[checker] |= found[literal]
+        regions = {checker: [(0, size, size)] for checker in checkers if checker not in lines}
+        for checker, checker_lines in lines.items():
+            checker_regions = regions[checker] = []
+            for line_start, line_end in sorted(checker_lines):
+                start = _find_tail_start(content, span, line_start, newline)
+                end = _find_head_end(content, span - 1, line_end, newline, size)
+                endpos = _find_head_end(content, 1, end, newline, size)
+                if checker_regions and start <= checker_regions[-1][1]:
+                    checker_regions[-1] = (checker_regions[-1][0], end, endpos)
+                else:
+                    checker_regions.append((start, end, endpos))
+        return regions
@@ -0,0 +1,80 @@
+# SPDX-License-Identifier: Apache-2.0
+
+import re
+
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+from .exceptions import WarningsConfigError
+
+
+class RegexEngine:
+    """Compiles regexes with Python's ``re`` module, which supports its full syntax
+
+    A regex with nested or adjacent quantifiers can take exponential time to search, due to backtracking.
+    """
+    name = "re"
+
+    def compile(self, regex):
+        """Compiles a regex
+
+        Args:
+            regex (str/bytes): The regex
+
+        Returns:
+            re.Pattern: The compiled regex
+        """
+        return re.compile(regex)
+
+    def is_native(self, pattern):
+        """Checks whether a pattern has been compiled by this engine, so that it can be combined with its other patterns
+
+        Args:
+            pattern (re.Pattern): The compiled regex
+
+        Returns:
+            bool: True if the pattern has been compiled by this engine
+        """
+        return isinstance(pattern, re.Pattern)
+
+
+class Re2Engine(RegexEngine):
+    """Compiles regexes with RE2, which searches in linear time, if the ``google-re2`` package is installed
+
+    Regexes that RE2 doesn't support, e.g. with lookarounds or backreferences, are compiled with ``re`` instead.
+    Note that ``\\d``, ``\\s``, ``\\w`` and ``\\b`` of RE2 only match ASCII characters.
+    """
+    name = "re2"
+
+    def __init__(self):
+        """Constructor
+
+        Raises:
+            WarningsConfigError: The ``google-re2`` package is not installed
+        """
+        if re2 is None:
+            raise WarningsConfigError("Regex engine 're2' requires the 'google-re2' package to be installed")
+
+    def compile(self, regex):
+        """Compiles a regex with RE2, or with ``re`` if RE2 doesn't support it
+
+        Args:
+            regex (str/bytes): The regex
+
+        Returns:
+            re2._Regexp/re.Pattern: The compiled regex
+        """
+        options = re2.Options()
+        options.log_errors = False
+        try:
+            return re2.compile(regex, options)
+        except re2.error:
+            return super().compile(regex)
+
+    def is_native(self, pattern):
+        return not isinstance(pattern, re.Pattern)
+
+
+REGEX_ENGINES = {engine.name: engine for engine in (RegexEngine, Re2Engine)}
@@ -1,16 +1,18 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import sys
+from collections import Counter
 
 from junitparser import Error, Failure
 
 from .exceptions import WarningsConfigError
-from .junit_checker import JUnitChecker
+from .junit_checker import JUnitChecker, JUnitStreamParser
 from .warnings_checker import WarningsChecker
 
 
 class RobotChecker(WarningsChecker):
     name = "robot"
+    binary_input = True
     logging_fmt = "{checker.name_repr}: {message}"
 
     def __init__(self, *logging_args):
@@ -18,6 +20,11 @@ class RobotChecker(WarningsChecker):
         super().__init__(*logging_args)
         self.checkers = []
         self.allow_unconfigured = True
+        self._ignored_testcases = Counter()  # amount of test cases that no sub-checker has checked, by classname
+        self._parser = None
+        self._suite_index = None
+        self._failures = 0  # failures and errors of the test cases that have been parsed
+        self._kept_failures = []  # failures and errors not to be excluded of each sub-checker
 
     @property
     def minimum(self):
@@ -51,10 +58,20 @@ class RobotChecker(WarningsChecker):
         for checker in self.checkers:
             checker.maximum = maximum
 
+    @property
+    def regex_engine(self):
+        """RegexEngine: Engine that compiles the regexes of the checker and of its sub-checkers"""
+        return self._regex_engine
+
+    @regex_engine.setter
+    def regex_engine(self, engine):
+        WarningsChecker.regex_engine.fset(self, engine)
+        for checker in self.checkers:
+            checker.regex_engine = engine
+
     @property
     def ignored_testsuites(self):
-        ignored_testcases = set.intersection(*(c.ignored_testsuites for c in self.checkers))
-        return sorted({t.classname.split(".")[-1] for t in ignored_testcases})
+        return sorted({classname.split(".")[-1] for classname in self._ignored_testcases})
 
     def check(self, content):
         """
@@ -64,8 +81,72 @@ class RobotChecker(WarningsChecker):
         Args:
             content (str): The content to parse
         """
-        for checker in self.checkers:
-            checker.check(content)
+        self.feed(content)
+        self.flush()
+
+    def feed(self, chunk):
+        """Parses the next chunk of the XML content once for all sub-checkers
+
+        Each test case is checked by the sub-checkers of the test suites it belongs to, as soon as it has been parsed.
+
+        Args:
+            chunk (bytes/str): The next chunk of the content to parse
+        """
+        if self._parser is None:
+            self._parser = JUnitStreamParser(self._check_testcase)
+            self._suite_index = SuiteIndex(checker.suite_name for checker in self.checkers)
+            self._failures = 0
+            self._kept_failures = [0] * len(self.checkers)
+        self._parser.feed(chunk.encode("utf-8") if isinstance(chunk, str) else chunk)
+
+    def flush(self):
+        """Lets each sub-checker count the failures in the content that has been fed
+
+        Raises:
+            SystemExit: No suite with the name of a sub-checker found. Returning error code -1.
+        """
+        if self._parser is None:
+            return
+        parser, self._parser = self._parser, None
+        is_parsed = parser.close() is not None
+        for checker, kept_failures in zip(self.checkers, self._kept_failures):
+            if is_parsed:
+                # the failures of test cases of other suites are excluded
+                checker.count += parser.count(self._failures - kept_failures)
+            else:
+                checker.logger.error(parser.error.msg)
+            checker._verify_suite_name()
+
+    def merge(self, other):
+        """Adds the results of another RobotChecker
+
+        The results of the sub-checkers are not included.
+
+        Args:
+            other (RobotChecker): Checker with the same configuration
+        """
+        super().merge(other)
+        self._ignored_testcases.update(other._ignored_testcases)
+
+    def _check_testcase(self, testcase):
+        """Lets the sub-checkers of the test suites that a test case belongs to check it
+
+        A test case belongs to a test suite if its ``classname`` ends with the name of the test suite.
+
+        Args:
+            testcase (junitparser.TestCase): Test case element to check for failure or error
+
+        Returns:
+            int: 0, since the failures/errors to exclude are counted for each sub-checker
+        """
+        is_failure = isinstance(testcase.result, (Failure, Error))
+        self._failures += is_failure
+        indexes = self._suite_index.find(testcase.classname)
+        if not indexes:
+            self._ignored_testcases[testcase.classname] += 1
+        for index in indexes:
+            self._kept_failures[index] += is_failure - self.checkers[index]._check_suite_testcase(testcase)
+        return 0
 
     def return_count(self):
         """Getter function for the amount of warnings found
@@ -81,6 +162,22 @@ class RobotChecker(WarningsChecker):
                                       f"incomplete configuration: {self.ignored_testsuites}")
         return self.count
 
+    def is_maximum_exceeded(self):
+        """Function for checking whether the warning count of a sub-checker already exceeds its configured maximum
+
+        Returns:
+            bool: True if a sub-checker has found more warnings than its maximum limit allows
+        """
+        return any(checker.is_maximum_exceeded() for checker in self.checkers)
+
+    def is_outcome_fixed(self):
+        """Function for checking whether parsing more content can no longer change the outcome of any sub-checker
+
+        Returns:
+            bool: True if the maximum limit of each sub-checker is exceeded already
+        """
+        return all(checker.is_outcome_fixed() for checker in self.checkers)
+
     def return_check_limits(self):
         """Function for checking whether the warning count is within the configured limits
 
@@ -100,6 +197,7 @@ class RobotChecker(WarningsChecker):
         check_suite_name = config.get("check_suite_names", True)
         for suite_config in config["suites"]:
             checker = RobotSuiteChecker(suite_config["name"], *self.logging_args, check_suite_name=check_suite_name)
+            checker.regex_engine = self.regex_engine
             checker.parse_config(suite_config)
             self.checkers.append(checker)
 
@@ -119,7 +217,12 @@ class RobotSuiteChecker(JUnitChecker):
         self.suite_name = suite_name
         self.check_suite_name = check_suite_name
         self.is_valid_suite_name = False
-        self.ignored_testsuites = set()
+        self.ignored_testsuites = Counter()  # amount of test cases of other suites, by classname
+
+    @property
+    def counts_only(self):
+        """bool: False, since each test case needs to be checked to find out which test suite it belongs to"""
+        return False
 
     @property
     def suite_name_repr(self):
@@ -139,23 +242,96 @@ class RobotSuiteChecker(JUnitChecker):
             int: 1 if a failure/error is to be subtracted from the final count, 0 otherwise
         """
         if testcase.classname.endswith(self.suite_name):
-            self.is_valid_suite_name = True
-            return super()._check_testcase(testcase)
-        self.ignored_testsuites.add(testcase)
+            return self._check_suite_testcase(testcase)
+        self.ignored_testsuites[testcase.classname] += 1
         return int(isinstance(testcase.result, (Failure, Error)))
 
-    def check(self, content):
-        """Function for counting the number of JUnit failures in a specific text
+    def _check_suite_testcase(self, testcase):
+        """Handles the check of a test case element that belongs to the suite
+
+        Args:
+            testcase (junitparser.TestCase): Test case element to check for failure or error
+
+        Returns:
+            int: 1 if a failure/error is to be subtracted from the final count, 0 otherwise
+        """
+        self.is_valid_suite_name = True
+        return super()._check_testcase(testcase)
+
+    def flush(self):
+        """Counts the failures and errors in the XML content that has been fed by means of :meth:`feed`
 
         The test cases with a ``classname`` that does not end with the ``name`` class attribute are ignored.
 
+        Raises:
+            SystemExit: No suite with name ``self.suite_name`` found. Returning error code -1.
+        """
+        super().flush()
+        self._verify_suite_name()
+
+    def merge(self, other):
+        """Adds the results of another RobotSuiteChecker
+
         Args:
-            content (str): The content to parse
+            other (RobotSuiteChecker): Checker with the same configuration
+
+        Raises:
+            SystemExit: No suite with name ``self.suite_name`` found. Returning error code -1.
+        """
+        super().merge(other)
+        self.is_valid_suite_name |= other.is_valid_suite_name
+        self.ignored_testsuites.update(other.ignored_testsuites)
+        self._verify_suite_name()
+
+    def _verify_suite_name(self):
+        """Exits when a test suite with name ``self.suite_name`` is required but has not been found
 
         Raises:
             SystemExit: No suite with name ``self.suite_name`` found. Returning error code -1.
         """
-        super().check(content)
         if not self.is_valid_suite_name and self.check_suite_name:
             self.logger.error(f"No suite with name {self.suite_name!r} found. Returning error code -1.")
             sys.exit(-1)
+
+
+class SuiteIndex:
+    """Index of test suite names that finds the names that a classname ends with
+
+    The names are stored reversed in a trie, so that the names that are a suffix of a classname are found by walking
+    along the reversed classname once, however many names there are. The outcome is cached for each classname, since
+    the test cases of a test suite share their classname.
+    """
+
+    def __init__(self, names):
+        """Constructor
+
+        Args:
+            names (iterable[str]): Names of the test suites; an empty name matches every classname
+        """
+        self._trie = {}
+        self._matches = {}
+        for index, name in enumerate(names):
+            node = self._trie
+            for char in reversed(name):
+                node = node.setdefault(char, {})
+            node.setdefault(None, []).append(index)
+
+    def find(self, classname):
+        """Finds the test suite names that a classname ends with
+
+        Args:
+            classname (str): The classname of a test case
+
+        Returns:
+            list[int]: Indexes of the names that are a suffix of the classname, in ascending order
+        """
+        if classname not in self._matches:
+            node = self._trie
+            indexes = list(node.get(None, []))
+            for char in reversed(classname):
+                node = node.get(char)
+                if node is None:
+                    break
+                indexes.extend(node.get(None, []))
+            self._matches[classname] = sorted(indexes)
+        return self._matches[classname]
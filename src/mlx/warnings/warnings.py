@@ -2,28 +2,71 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import argparse
+import codecs
 import errno
-import glob
+import io
 import json
+import locale
 import logging
+import mmap
 import os
+import queue
+import signal
 import subprocess
 import sys
+import threading
+import time
 from importlib.metadata import version
 from pathlib import Path
 
 from ruamel.yaml import YAML
 
+from .archives import MEMBER_SEPARATOR, iter_logfile_contents
+from .compression import DECOMPRESSOR_TYPES
+from .discovery import discover_logfiles
 from .exceptions import WarningsConfigError
 from .junit_checker import JUnitChecker
+from .parallel import check_file_per_checker, check_files, iter_checkers, split_logfiles
 from .polyspace_checker import PolyspaceChecker
-from .regex_checker import CoverityChecker, DoxyChecker, SphinxChecker, XMLRunnerChecker
+from .preprocessing import Preprocessor
+from .regex_checker import (CoverityChecker, DoxyChecker, RegexChecker, RegexScanner, SphinxChecker, XMLRunnerChecker,
+                            is_plain_ascii)
+from .regex_engines import REGEX_ENGINES, RegexEngine
 from .robot_checker import RobotChecker
 
 __version__ = version("mlx-warnings")
 
 LOGGER = logging.getLogger(__name__)
 
+COMMAND_LINES_PER_CHUNK = 1000  # maximum amount of lines of command output to feed to the checkers at once
+ABORT_GRACE_PERIOD = 10  # seconds to wait for a terminated command before killing it
+GROUP_POLL_INTERVAL = 0.05  # seconds to wait before checking again whether a terminated process group has ended
+FOLLOW_INTERVAL = 0.5  # seconds to wait for new content of a followed logfile
+SYNCHRONIZE = 0x00100000  # access right to wait for a process on Windows
+WAIT_TIMEOUT = 0x00000102  # result of waiting for a process that is still running on Windows
+
+
+def map_ascii_file(file, chunk_size=2 ** 20):
+    """Memory-maps an open file if it consists of ASCII text that can be parsed without decoding it
+
+    Args:
+        file (_io.TextIOWrapper): The open file
+        chunk_size (int): Amount of bytes to inspect at once
+
+    Returns:
+        mmap.mmap/None: Read-only memory map of the file; None if the file cannot be mapped or is not plain ASCII text
+    """
+    if isinstance(getattr(file, "buffer", None), DECOMPRESSOR_TYPES):
+        return None
+    try:
+        buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    except (AttributeError, OSError, ValueError):
+        return None
+    if not is_plain_ascii(buffer, chunk_size):
+        buffer.close()
+        return None
+    return buffer
+
 
 class WarningsPlugin:
 
@@ -42,6 +85,11 @@ class WarningsPlugin:
         self._maximum = 0
         self.count = 0
         self.printout = False
+        self.chunk_size = 2 ** 20  # amount of characters to read from a logfile at once
+        self.fail_fast = False
+        self.preprocessor = Preprocessor()  # cleans up the content once for all regex checkers
+        self.regex_engine = RegexEngine()  # compiles the regexes of the checkers, e.g. for exclusion
+        self._scanners = {}  # search the content that is fed for the warnings of all regex checkers, for each stream
 
     def activate_checker(self, checker_type, *logging_args):
         """
@@ -56,6 +104,10 @@ class WarningsPlugin:
         checker = checker_type(*logging_args)
         checker.cq_enabled = self.cq_enabled and checker.name in ("doxygen", "sphinx", "xmlrunner", "polyspace",
                                                                   "coverity")
+        checker.fail_fast = self.fail_fast
+        checker.regex_engine = self.regex_engine
+        if isinstance(checker, RegexChecker):
+            checker.preprocessor = self.preprocessor
         self.activated_checkers[checker.name] = checker
         return checker
 
@@ -98,16 +150,62 @@ class WarningsPlugin:
         if not self.activated_checkers:
             LOGGER.error("No checkers activated. Please use activate_checker function")
         else:
+            regex_checkers = []
             for checker in self.activated_checkers.values():
                 if checker.name == "polyspace":
                     raise WarningsConfigError("Function check() cannot be used with Polyspace checker.")
-                else:
+                elif isinstance(checker, RegexChecker):
+                    regex_checkers.append(checker)
+                elif not (self.fail_fast and checker.is_outcome_fixed()):
                     checker.check(content)
+            if regex_checkers:
+                RegexScanner(regex_checkers, self.preprocessor).check(content)
+
+    def feed(self, chunk, buffered=False, stream=None):
+        """
+        Feed the next chunk of content to the activated checkers that parse content incrementally
+
+        Args:
+            chunk (str): The next chunk of the content to parse, consisting of complete lines
+            buffered (bool): Also feed the checkers that don't parse content incrementally, e.g. XML parsers, which
+                only count their warnings when :meth:`flush` is called
+            stream (object): Key of the stream that the chunk belongs to, e.g. the stdout or stderr of a command; the
+                regex checkers search each stream separately, so that a warning that spans multiple lines doesn't get
+                mixed up with the lines of another stream
+        """
+        if self.printout:
+            LOGGER.warning(chunk[:-1] if chunk.endswith("\n") else chunk)
+        if stream not in self._scanners:
+            self._scanners[stream] = RegexScanner([checker for checker in self.activated_checkers.values()
+                                                   if isinstance(checker, RegexChecker)], self.preprocessor)
+        self._scanners[stream].feed(chunk)
+        for checker in self.activated_checkers.values():
+            if (checker.streaming or buffered) and not isinstance(checker, RegexChecker):
+                checker.feed(chunk)
+
+    def flush(self, buffered=False):
+        """Let the activated checkers that parse content incrementally parse the content that has been fed
+
+        Args:
+            buffered (bool): Also let the checkers that don't parse content incrementally parse the content that has
+                been fed
+        """
+        for scanner in self._scanners.values():
+            scanner.flush()
+        self._scanners = {}
+        for checker in self.activated_checkers.values():
+            if (checker.streaming or buffered) and not isinstance(checker, RegexChecker):
+                checker.flush()
 
     def check_logfile(self, file):
         """
         Count the number of warnings in a specified content
 
+        The file is read in chunks of ``chunk_size`` characters, which are fed to each activated checker. Checkers with
+        ``binary_input``, e.g. XML parsers, are fed chunks of the underlying binary file instead, without decoding them.
+        The regex checkers search each chunk together, with a single RegexScanner. They search a memory map of the
+        file instead when the file consists of plain ASCII text that doesn't need to be preprocessed.
+
         Args:
             content (_io.TextIOWrapper): The open file to parse
         """
@@ -116,11 +214,61 @@ class WarningsPlugin:
         elif "polyspace" in self.activated_checkers:
             if len(self.activated_checkers) > 1:
                 raise WarningsConfigError("Polyspace checker cannot be combined with other warnings checkers")
-            self.activated_checkers["polyspace"].check(file)
+            if not (self.fail_fast and self.is_outcome_fixed()):
+                self.activated_checkers["polyspace"].check(file)
         else:
-            content = file.read()
-            for checker in self.activated_checkers.values():
-                checker.check(content)
+            checkers = [checker for checker in self.activated_checkers.values()
+                        if not (self.fail_fast and checker.is_outcome_fixed())]
+            regex_checkers = [checker for checker in checkers if isinstance(checker, RegexChecker)]
+            checkers = [checker for checker in checkers if not isinstance(checker, RegexChecker)]
+            if regex_checkers and not self.preprocessor.changes_plain_text:
+                buffer = map_ascii_file(file, self.chunk_size)
+                if buffer is not None:
+                    with buffer:
+                        RegexScanner(regex_checkers, self.preprocessor).check_buffer(buffer)
+                    regex_checkers = []
+            if not regex_checkers and not checkers:
+                return
+            # checkers that parse bytes, e.g. XML parsers that detect the encoding, read the underlying binary file
+            binary = hasattr(file, "buffer") and any(checker.binary_input for checker in checkers)
+            decoder = None
+            if binary and (regex_checkers or not all(checker.binary_input for checker in checkers)):
+                decoder = io.IncrementalNewlineDecoder(codecs.getincrementaldecoder(file.encoding)(file.errors), True)
+            scanner = RegexScanner(regex_checkers, self.preprocessor)
+            while True:
+                if binary:
+                    data = file.buffer.read(self.chunk_size)
+                    chunk = "" if decoder is None else decoder.decode(data, final=not data)
+                else:
+                    data = chunk = file.read(self.chunk_size)
+                scanner.feed(chunk)
+                for checker in checkers:
+                    checker.feed(data if checker.binary_input else chunk)
+                if not data or (self.fail_fast and all(checker.is_outcome_fixed()
+                                                       for checker in regex_checkers + checkers)):
+                    break
+            scanner.flush()
+            for checker in checkers:
+                checker.flush()
+
+    def check_path(self, path, member_pattern=None):
+        """
+        Count the number of warnings in a logfile, or in each file in a zip or tar archive
+
+        Args:
+            path (str): Path of the logfile or archive
+            member_pattern (str/None): optional - Pattern for the names of the members of the archive to parse
+
+        Returns:
+            int: Number of parsed files
+        """
+        amount = 0
+        for file in iter_logfile_contents(path, member_pattern):
+            self.check_logfile(file)
+            amount += 1
+            if self.fail_fast and self.is_outcome_fixed():
+                break
+        return amount
 
     def configure_maximum(self, maximum):
         """Configure the maximum amount of warnings for each activated checker
@@ -185,6 +333,36 @@ class WarningsPlugin:
 
         return 0
 
+    def is_maximum_exceeded(self):
+        """Function for checking whether any activated checker already exceeds its configured maximum
+
+        Returns:
+            bool: True if a checker has found more warnings than its maximum limit allows
+        """
+        return any(checker.is_maximum_exceeded() for checker in self.activated_checkers.values())
+
+    def is_outcome_fixed(self):
+        """Function for checking whether parsing more content can no longer change the outcome of any checker
+
+        Returns:
+            bool: True if the maximum limit of each activated checker is exceeded already
+        """
+        checkers = self.activated_checkers.values()
+        return bool(checkers) and all(checker.is_outcome_fixed() for checker in checkers)
+
+    def toggle_fail_fast(self, fail_fast):
+        """Toggle stopping to parse content as soon as the outcome of all activated checkers is fixed
+
+        The amount of warnings that is found is then a lower bound, so this shouldn't be combined with an output file
+        or a Code Quality report.
+
+        Args:
+            fail_fast (bool): True stops parsing as soon as the maximum limit of each checker is exceeded
+        """
+        self.fail_fast = fail_fast
+        for checker in self.activated_checkers.values():
+            checker.fail_fast = fail_fast
+
     def toggle_printout(self, printout):
         """Toggle printout of all the parsed content
 
@@ -267,6 +445,33 @@ def warnings_wrapper(args):
                         help="Treat program arguments as command to execute to obtain data")
     parser.add_argument("--ignore-retval", dest="ignore", action="store_true",
                         help="Ignore return value of the executed command")
+    parser.add_argument("--abort-command", action="store_true",
+                        help="Terminate the executed command and its child processes as soon as the maximum amount of "
+                             "warnings of a checker is exceeded")
+    parser.add_argument("--abort-grace-period", type=float, default=ABORT_GRACE_PERIOD, metavar="SECONDS",
+                        help="Seconds to wait for the terminated command to end before killing it "
+                             f"(default: {ABORT_GRACE_PERIOD})")
+    parser.add_argument("--strip-timestamps", action="store_true",
+                        help="Remove the timestamp that GitLab CI or Jenkins prepends to each line before parsing it")
+    parser.add_argument("--max-line-length", type=int, metavar="CHARACTERS",
+                        help="Skip lines that are longer than this amount of characters, e.g. minified output")
+    parser.add_argument("--regex-engine", choices=sorted(REGEX_ENGINES), default=RegexEngine.name,
+                        help="Engine that compiles the regexes, e.g. for exclusion; 're2' searches in linear time, "
+                             "requires the google-re2 package and falls back to 're' for lookarounds and "
+                             f"backreferences (default: {RegexEngine.name})")
+    parser.add_argument("--jobs", type=int, default=1,
+                        help="Maximum amount of processes to parse multiple logfiles, or a logfile with multiple checkers, in "
+                             "parallel")
+    parser.add_argument("--fail-fast", action="store_true",
+                        help="Stop parsing as soon as the maximum limit of each checker is exceeded; the reported "
+                             "amounts of warnings are then lower bounds")
+    parser.add_argument("--follow", action="store_true",
+                        help="Keep parsing the logfile while it grows, until the maximum amount of warnings is "
+                             "exceeded, the --follow-until text is found, the --follow-pid process ends or Ctrl+C")
+    parser.add_argument("--follow-until", metavar="TEXT",
+                        help="Stop following the logfile after a line that contains this text")
+    parser.add_argument("--follow-pid", metavar="PID", type=int,
+                        help="Stop following the logfile when the process with this ID, which writes it, has ended")
     parser.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
     parser.add_argument("logfile", nargs="+", help="Logfile (or command) that might contain warnings")
     parser.add_argument("flags", nargs=argparse.REMAINDER,
@@ -284,6 +489,9 @@ def warnings_wrapper(args):
 
     logging_args = [args.verbose, args.output]
     warnings = WarningsPlugin(cq_enabled=code_quality_enabled)
+    warnings.preprocessor.strip_timestamps = args.strip_timestamps
+    warnings.preprocessor.max_line_length = args.max_line_length
+    warnings.regex_engine = REGEX_ENGINES[args.regex_engine]()
     # Read config file
     if args.configfile is not None:
         checker_flags = args.sphinx or args.doxygen or args.junit or args.coverity or args.xmlrunner or args.robot
@@ -323,6 +531,23 @@ def warnings_wrapper(args):
     if args.include_sphinx_deprecation and "sphinx" in warnings.activated_checkers.keys():
         warnings.get_checker("sphinx").include_sphinx_deprecation()
 
+    if (args.follow_until is not None or args.follow_pid is not None) and not args.follow:
+        LOGGER.error("Options --follow-until and --follow-pid require --follow")
+        sys.exit(2)
+    if args.abort_command and not args.command:
+        LOGGER.error("Option --abort-command requires --command")
+        sys.exit(2)
+    if args.follow and args.command:
+        LOGGER.error("Follow mode cannot be combined with --command")
+        sys.exit(2)
+    if args.follow and "polyspace" in warnings.activated_checkers:
+        raise WarningsConfigError("Follow mode cannot be combined with Polyspace checker enabled")
+    if args.fail_fast:
+        if args.output is not None or args.code_quality:
+            LOGGER.error("Fail-fast mode cannot be combined with --output or --code-quality")
+            sys.exit(2)
+        warnings.toggle_fail_fast(True)
+
     if args.command:
         if "polyspace" in warnings.activated_checkers:
             raise WarningsConfigError("Input argument command cannot be combined with Polyspace checker enabled")
@@ -330,7 +555,7 @@ def warnings_wrapper(args):
         if args.flags:
             cmd.extend(args.flags)
         warnings.toggle_printout(True)
-        retval = warnings_command(warnings, cmd)
+        retval = warnings_command(warnings, cmd, abort=args.abort_command, grace_period=args.abort_grace_period)
 
         if (not args.ignore) and (retval != 0):
             return retval
@@ -338,63 +563,191 @@ def warnings_wrapper(args):
         if args.flags:
             LOGGER.warning(f"Some keyword arguments have been ignored because they followed positional arguments: "
                            f"{' '.join(args.flags)!r}")
-        retval = warnings_logfile(warnings, args.logfile)
-        if retval != 0:
-            return retval
+        if args.follow:
+            logfiles, missing = discover_logfiles(args.logfile)
+            if missing is not None or len(logfiles) != 1 or logfiles[0].member is not None:
+                LOGGER.error("Follow mode requires exactly one existing logfile")
+                return 1
+            warnings_follow(warnings, logfiles[0].path, sentinel=args.follow_until, pid=args.follow_pid)
+        else:
+            retval = warnings_logfile(warnings, args.logfile, jobs=args.jobs)
+            if retval != 0:
+                return retval
 
     warnings.return_count()
+    if args.verbose:
+        log_exclusion_cache_info(warnings)
     if args.code_quality:
         warnings.write_code_quality_report(args.code_quality)
+    if warnings.fail_fast and warnings.is_outcome_fixed():
+        LOGGER.warning("Stopped parsing because the maximum limit of each checker is exceeded: the amounts of warnings "
+                       "are lower bounds")
     return warnings.return_check_limits()
 
 
-def warnings_command(warnings, cmd):
+def log_exclusion_cache_info(warnings):
+    """Logs the hit rate of the cache of exclusion outcomes for each (sub-)checker with regexes for exclusion
+
+    Args:
+        warnings (WarningsPlugin): Object for warnings where errors should be logged
+    """
+    for checker in iter_checkers(warnings):
+        info = checker.exclusion_cache_info()
+        if lookups := info.hits + info.misses:
+            checker.logger.info(f"exclusion cache: {info.hits} hits and {info.misses} misses "
+                                f"({info.hits / lookups:.1%} hit rate)")
+
+
+def warnings_command(warnings, cmd, abort=False, grace_period=ABORT_GRACE_PERIOD):
     """Execute command to obtain input for parsing for warnings
 
     Usually log files are output of the commands. To avoid this additional step
     this function runs a command instead and parses the stderr and stdout of the
-    command for warnings.
+    command for warnings. The output is parsed while the command is running: the
+    lines of each stream are fed to the checkers that parse content incrementally
+    as soon as they are available, and searched separately from the lines of the
+    other stream. The other checkers parse the complete stdout and stderr
+    separately when the command has finished.
+
+    When aborting is enabled, the command runs in its own process group, which gets
+    terminated as soon as the maximum amount of warnings of a checker is exceeded.
+    Since a warning can span multiple lines, it is counted once the command has
+    printed the next lines.
 
     Args:
         warnings (WarningsPlugin): Object for warnings where errors should be logged
         cmd (list): List of commands (str), which should be executed to obtain input for parsing
+        abort (bool): Terminate the command as soon as the maximum amount of warnings of a checker is exceeded
+        grace_period (float): Amount of seconds to wait for the terminated command before killing it
 
     Return:
-        int: Return value of executed command(s)
+        int: Return value of executed command(s); 0 if the command has been terminated because the maximum
+            amount of warnings of a checker has been exceeded
 
     Raises:
         OSError: When program is not installed.
     """
+    group_kwargs = {}
+    if abort:
+        if sys.platform == "win32":
+            group_kwargs["creationflags"] = subprocess.CREATE_NEW_PROCESS_GROUP
+        else:
+            group_kwargs["start_new_session"] = True
     try:
         LOGGER.info(f"Executing: {cmd}")
         proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
-                                stdin=subprocess.PIPE, bufsize=1, universal_newlines=True)
-        out, err = proc.communicate()
-        # Check stdout
-        if out:
-            try:
-                warnings.check(out.decode(encoding="utf-8"))
-            except AttributeError:
-                warnings.check(out)
-        # Check stderr
-        if err:
-            try:
-                warnings.check(err.decode(encoding="utf-8"))
-            except AttributeError:
-                warnings.check(err)
-        return proc.returncode
+                                stdin=subprocess.PIPE, bufsize=1, universal_newlines=True, **group_kwargs)
     except OSError as err:
         if err.errno == errno.ENOENT:
             LOGGER.error("It seems like program " + str(cmd) + " is not installed.")
         raise
+    proc.stdin.close()
+    buffered_output = None
+    if any(not checker.streaming for checker in warnings.activated_checkers.values()):
+        buffered_output = {proc.stdout: [], proc.stderr: []}
+    output_queue = queue.Queue()
+    readers = [threading.Thread(target=_enqueue_lines, args=(stream, output_queue), daemon=True)
+               for stream in (proc.stdout, proc.stderr)]
+    for reader in readers:
+        reader.start()
+    open_streams = len(readers)
+    aborted = False
+    while open_streams:
+        runs = []  # consecutive lines of the same stream, in the order in which they have been read
+        amount = 0
+        stream, line = output_queue.get()
+        while True:
+            if line is None:
+                open_streams -= 1
+            else:
+                if buffered_output is not None:
+                    buffered_output[stream].append(line)
+                if not runs or runs[-1][0] is not stream:
+                    runs.append((stream, []))
+                runs[-1][1].append(line if line.endswith("\n") else f"{line}\n")
+                amount += 1
+            if amount >= COMMAND_LINES_PER_CHUNK:
+                break
+            try:
+                stream, line = output_queue.get_nowait()
+            except queue.Empty:
+                break
+        for stream, lines in runs:
+            warnings.feed("".join(lines), stream=stream)
+        if runs and abort and not aborted and warnings.is_maximum_exceeded():
+            LOGGER.warning("Terminating the command because the maximum amount of warnings is exceeded")
+            terminate_process_group(proc, grace_period)
+            aborted = True
+    warnings.flush()
+    for reader in readers:
+        reader.join()
+    proc.stdout.close()
+    proc.stderr.close()
+    if buffered_output is not None:
+        for checker in warnings.activated_checkers.values():
+            if not checker.streaming:
+                for lines in buffered_output.values():
+                    if lines:
+                        checker.check("".join(lines))
+    retval = proc.wait()
+    return 0 if aborted else retval
+
+
+def terminate_process_group(proc, grace_period=ABORT_GRACE_PERIOD):
+    """Terminates a process that has been started in a new process group, and all other processes in the group
+
+    The processes get the signal SIGTERM first. The ones that haven't ended after the grace period, e.g. child
+    processes that outlive the process, are killed. On Windows, the process is terminated and killed without its child
+    processes.
+
+    Args:
+        proc (subprocess.Popen): The process, which leads its process group
+        grace_period (float): Amount of seconds to wait for the processes to end before killing them
+    """
+    if sys.platform == "win32":
+        proc.terminate()
+        try:
+            proc.wait(timeout=grace_period)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+        return
+    try:
+        os.killpg(proc.pid, signal.SIGTERM)
+    except ProcessLookupError:
+        return
+    deadline = time.monotonic() + grace_period
+    try:
+        proc.wait(timeout=grace_period)
+    except subprocess.TimeoutExpired:
+        pass
+    try:
+        while time.monotonic() < deadline:
+            os.killpg(proc.pid, 0)  # raises ProcessLookupError when all processes in the group have ended
+            time.sleep(min(GROUP_POLL_INTERVAL, max(deadline - time.monotonic(), 0)))
+        os.killpg(proc.pid, signal.SIGKILL)  # the processes in the group that are still alive
+    except (ProcessLookupError, PermissionError):
+        pass
 
 
-def warnings_logfile(warnings, log):
+def _enqueue_lines(stream, output_queue):
+    """Puts each line of the stream in the queue, followed by None when the end of the stream has been reached
+
+    Args:
+        stream (_io.TextIOWrapper): Output stream of a process
+        output_queue (queue.Queue): Queue of (stream, line) tuples
+    """
+    for line in iter(stream.readline, ""):
+        output_queue.put((stream, line))
+    output_queue.put((stream, None))
+
+
+def warnings_logfile(warnings, log, jobs=1):
     """Parse logfile for warnings
 
     Args:
         warnings (WarningsPlugin): Object for warnings where errors should be logged
         log: Logfile for parsing
+        jobs (int): Maximum amount of processes to parse logfiles, or a logfile with multiple checkers, in parallel
 
     Return:
         0: Log files existed and are parsed successfully
@@ -406,16 +759,131 @@ def warnings_logfile(warnings, log):
     # executing the script on windows (in that case there is no shell expansion of wildcards)
     # so that the script can be used in the exact same way even when moving from one
     # OS to another.
-    for file_wildcard in log:
-        if glob.glob(file_wildcard):
-            for logfile in glob.glob(file_wildcard):
-                with open(logfile) as file:
-                    warnings.check_logfile(file)
-        else:
-            LOGGER.error(f"FILE: {file_wildcard} does not exist")
-            return 1
+    logfiles, missing = discover_logfiles(log)
+    retval = 0
+    if missing is not None:
+        LOGGER.error(f"FILE: {missing} does not exist")
+        retval = 1
+
+    parts = split_logfiles(warnings, logfiles, jobs)
+    per_checker = len(warnings.activated_checkers) > 1 and "polyspace" not in warnings.activated_checkers
+    if jobs > 1 and len(parts) > 1:
+        unmatched = check_files(warnings, parts, jobs)
+    elif jobs > 1 and len(logfiles) == 1 and per_checker:
+        logfile = logfiles[0]
+        unmatched = [] if check_file_per_checker(warnings, logfile, jobs) or logfile.member is None else [logfile]
+    else:
+        unmatched = []
+        for logfile in logfiles:
+            if warnings.fail_fast and warnings.is_outcome_fixed():
+                break
+            if not warnings.check_path(logfile.path, logfile.member) and logfile.member is not None:
+                unmatched.append(logfile)
+    for logfile in unmatched:
+        LOGGER.error(f"FILE: {logfile.path}{MEMBER_SEPARATOR}{logfile.member} does not exist")
+        retval = 1
+    return retval
+
+
+def warnings_follow(warnings, logfile, sentinel=None, pid=None, interval=FOLLOW_INTERVAL):
+    """Parse a logfile for warnings while it is being written
+
+    The content that is appended to the logfile is fed to the activated checkers, and the amount of warnings of each
+    checker that parses content incrementally is reported when it changes. Following stops as soon as the maximum
+    amount of warnings of a checker is exceeded, when a line with the sentinel has been parsed, or when the process
+    that writes the logfile has ended. Press Ctrl+C to stop following manually. Since a warning can span multiple
+    lines, a warning is only counted once the next lines have been written, or when following stops. The checkers that
+    don't parse content incrementally, e.g. the JUnit checker, are fed the content as well, but only count their
+    warnings when following stops.
+
+    Args:
+        warnings (WarningsPlugin): Object for warnings where errors should be logged
+        logfile (str): Path of the logfile to follow
+        sentinel (str/None): Text that marks the end of the logfile
+        pid (int/None): Identifier of the process that writes the logfile
+        interval (float): Amount of seconds to wait before checking for new content again
+    """
+    counts = {}
+    tail = ""
+    # the writer can have flushed part of a multi-byte character or of a \r\n line ending: decode it once it's complete
+    decoder = io.IncrementalNewlineDecoder(codecs.getincrementaldecoder(locale.getpreferredencoding(False))(), True)
+    found_sentinel = False
+    try:
+        with open(logfile, "rb") as file:
+            while True:
+                writer_ended = pid is not None and not process_exists(pid)
+                data = file.read(warnings.chunk_size)
+                while data:
+                    chunk = decoder.decode(data)
+                    if sentinel is not None:
+                        searched = tail + chunk
+                        index = searched.find(sentinel)
+                        if index != -1:
+                            line_end = searched.find("\n", index + len(sentinel))
+                            if line_end != -1:
+                                chunk = chunk[:line_end + 1 - len(tail)]
+                            warnings.feed(chunk, buffered=True)
+                            found_sentinel = True
+                            return
+                        tail = searched[-len(sentinel) + 1:] if len(sentinel) > 1 else ""
+                    warnings.feed(chunk, buffered=True)
+                    if warnings.is_maximum_exceeded():
+                        return
+                    data = file.read(warnings.chunk_size)
+                _report_counts(warnings, counts)
+                if writer_ended:
+                    return
+                time.sleep(interval)
+    except KeyboardInterrupt:
+        LOGGER.warning(f"Stopped following {logfile}")
+    finally:
+        if not found_sentinel:
+            warnings.feed(decoder.decode(b"", final=True), buffered=True)
+        warnings.flush(buffered=True)
+        _report_counts(warnings, counts)
+
+
+def _report_counts(warnings, counts):
+    """Logs the amount of warnings of each checker that parses content incrementally, if it has changed
+
+    Args:
+        warnings (WarningsPlugin): Object for warnings where errors should be logged
+        counts (dict): The amount of warnings that has been reported for each checker, which gets updated
+    """
+    for name, checker in warnings.activated_checkers.items():
+        if checker.streaming:
+            count = checker.return_count()
+            if counts.get(name, 0) != count:
+                counts[name] = count
+                checker.logger.warning(f"number of warnings so far: {count}")
+
 
-    return 0
+def process_exists(pid):
+    """Checks whether a process is running
+
+    Args:
+        pid (int): Identifier of the process
+
+    Returns:
+        bool: True if the process is running
+    """
+    if sys.platform == "win32":
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.OpenProcess(SYNCHRONIZE, False, pid)
+        if not handle:
+            return False
+        try:
+            return kernel32.WaitForSingleObject(handle, 0) == WAIT_TIMEOUT
+        finally:
+            kernel32.CloseHandle(handle)
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass  # the process exists but belongs to another user
+    return True
 
 
 def main():
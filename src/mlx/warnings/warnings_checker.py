@@ -3,11 +3,18 @@
 import abc
 import logging
 import os
-import re
+from collections import OrderedDict, namedtuple
 from math import inf
 from string import Template
 
+from .code_quality import Finding
 from .exceptions import WarningsConfigError
+from .patterns import PatternList
+from .regex_engines import RegexEngine
+
+EXCLUSION_CACHE_SIZE = 4096  # maximum number of texts for which the outcome of the exclusion regexes is remembered
+
+ExclusionCacheInfo = namedtuple("ExclusionCacheInfo", ["hits", "misses", "maxsize", "currsize"])
 
 
 def substitute_envvar(checker_config, keys):
@@ -40,6 +47,8 @@ class DebugOnlyFilter(logging.Filter):
 class WarningsChecker:
     name = "checker"
     logging_fmt = "{checker.name_repr}: {message}"
+    streaming = False  # whether the checker parses the chunks passed to feed() without buffering the content
+    binary_input = False  # whether feed() takes bytes, e.g. for an XML parser to decode them as declared
 
     def __init__(self, verbose, output):
         """Constructor
@@ -58,9 +67,16 @@ class WarningsChecker:
         self.cq_enabled = False
         self.cq_default_path = ".gitlab-ci.yml"
         self._cq_description_template = Template("$description")
-        self.exclude_patterns = []
-        self.include_patterns = []
+        self._regex_engine = RegexEngine()
+        self.exclude_patterns = PatternList()
+        self.include_patterns = PatternList()
+        self._exclusions = OrderedDict()  # least recently used cache of the outcome of _find_exclusion()
+        self._exclusion_key = None
+        self._exclusion_hits = 0
+        self._exclusion_misses = 0
         self.logging_args = (verbose, output)
+        self._chunks = []
+        self.fail_fast = False  # stop parsing as soon as the outcome is fixed
 
         self.logger = logging.getLogger(self.name)
         self.logger.setLevel(logging.WARNING)
@@ -100,6 +116,17 @@ class WarningsChecker:
         """List[dict]: list of code quality findings"""
         return self._cq_findings
 
+    @property
+    def regex_engine(self):
+        """RegexEngine: Engine that compiles the regexes of the checker, e.g. for exclusion"""
+        return self._regex_engine
+
+    @regex_engine.setter
+    def regex_engine(self, engine):
+        self._regex_engine = engine
+        self.exclude_patterns.engine = engine
+        self.include_patterns.engine = engine
+
     @property
     def cq_description_template(self):
         """Template: string.Template instance based on the configured template string"""
@@ -157,19 +184,51 @@ class WarningsChecker:
         """
         return
 
+    def feed(self, chunk):
+        """Feeds a chunk of content that is parsed once all chunks have been fed
+
+        Checkers that can parse partial content override this method together with :meth:`flush`. By default, the
+        chunks are buffered until :meth:`flush` is called.
+
+        Args:
+            chunk (str): The next chunk of the content to parse
+        """
+        self._chunks.append(chunk)
+
+    def flush(self):
+        """Parses the content that has been fed by means of :meth:`feed` and has not been parsed yet"""
+        if self._chunks:
+            content = "".join(self._chunks)
+            self._chunks = []
+            self.check(content)
+
+    def merge(self, other):
+        """Adds the results of another instance of this checker, e.g. one that has parsed a file in another process
+
+        The results of sub-checkers are not included. The code quality findings of the other checker get a fingerprint
+        that is unique in this process.
+
+        Args:
+            other (WarningsChecker): Checker with the same configuration
+        """
+        self.count += other.count
+        self._exclusion_hits += other._exclusion_hits
+        self._exclusion_misses += other._exclusion_misses
+        self._cq_findings.extend(Finding.from_dict(finding).to_dict() for finding in other._cq_findings)
+
     def add_patterns(self, regexes, pattern_container):
         """Adds regexes as patterns to the specified container
 
         Args:
             regexes (list[str]|None): List of regexes to add
-            pattern_container (list[re.Pattern]): Target storage container for patterns
+            pattern_container (PatternList): Target storage container for patterns
         """
         if regexes:
             if not isinstance(regexes, list):
                 raise TypeError("Expected a list value for exclude key in configuration file; got {}"
                                 .format(regexes.__class__.__name__))
             for regex in regexes:
-                pattern_container.append(re.compile(regex))
+                pattern_container.append(self.regex_engine.compile(regex))
 
     def return_count(self):
         """Getter function for the amount of warnings found
@@ -179,6 +238,22 @@ class WarningsChecker:
         """
         return self.count
 
+    def is_maximum_exceeded(self):
+        """Function for checking whether the warning count already exceeds the configured maximum
+
+        Returns:
+            bool: True if more warnings have been found than the maximum limit allows
+        """
+        return self.count > self._maximum
+
+    def is_outcome_fixed(self):
+        """Function for checking whether parsing more content can no longer change the outcome of this checker
+
+        Returns:
+            bool: True if the maximum limit is exceeded already
+        """
+        return self.is_maximum_exceeded()
+
     def return_check_limits(self):
         """Function for checking whether the warning count is within the configured limits
         A checker instance with sub-checkers is responsible for printing 'Returning error code X.'
@@ -238,16 +313,49 @@ class WarningsChecker:
         Returns:
             bool: True for exclusion, False for inclusion
         """
-        matching_exclude_pattern = self._search_patterns(content, self.exclude_patterns)
-        if not self._search_patterns(content, self.include_patterns) and matching_exclude_pattern:
+        if not len(self.exclude_patterns):
+            return False
+        matching_exclude_pattern = self._find_exclusion(content)
+        if matching_exclude_pattern is not None:
             self.logger.info(f"Excluded {content!r} because of configured regex {matching_exclude_pattern!r}")
             return True
         return False
 
-    @staticmethod
-    def _search_patterns(content, patterns):
-        """Returns the regex of the first pattern that matches specified content, None if nothing matches"""
-        for pattern in patterns:
-            if pattern.search(content):
-                return pattern.pattern
-        return None
+    def _find_exclusion(self, content):
+        """Finds the regex that excludes the specific text, unless a regex for inclusion matches it
+
+        The outcome is cached for the ``EXCLUSION_CACHE_SIZE`` most recently checked texts, since the same warning is
+        often reported many times, e.g. for a header file that is included by many source files. The cache is cleared
+        when the regexes for exclusion or inclusion change.
+
+        Args:
+            content (str): The content to parse
+
+        Returns:
+            str/None: The regex for exclusion that matches, None if the text must not be excluded
+        """
+        key = (self.exclude_patterns, len(self.exclude_patterns), self.include_patterns, len(self.include_patterns))
+        if key != self._exclusion_key:
+            self._exclusions.clear()
+            self._exclusion_key = key
+        if content in self._exclusions:
+            self._exclusion_hits += 1
+            self._exclusions.move_to_end(content)
+            return self._exclusions[content]
+        self._exclusion_misses += 1
+        matching_exclude_pattern = self.exclude_patterns.search(content)
+        if matching_exclude_pattern is not None and self.include_patterns.search(content) is not None:
+            matching_exclude_pattern = None
+        self._exclusions[content] = matching_exclude_pattern
+        if len(self._exclusions) > EXCLUSION_CACHE_SIZE:
+            self._exclusions.popitem(last=False)
+        return matching_exclude_pattern
+
+    def exclusion_cache_info(self):
+        """Statistics of the cache of texts that have been checked against the regexes for exclusion
+
+        Returns:
+            ExclusionCacheInfo: Number of hits and misses, the maximum size and the current size of the cache
+        """
+        return ExclusionCacheInfo(self._exclusion_hits, self._exclusion_misses, EXCLUSION_CACHE_SIZE,
+                                  len(self._exclusions))
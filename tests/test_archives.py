@@ -0,0 +1,41 @@
+import gzip
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+from mlx.warnings.archives import is_plain_logfile, match_member, open_logfile_part, split_member_pattern
+
+
+class TestArchives(TestCase):
+
+    def test_split_member_pattern(self):
+        self.assertEqual(("artifacts.zip", "**/*.xml"), split_member_pattern("artifacts.zip!**/*.xml"))
+        self.assertEqual(("*.tar.gz", "logs/*.log"), split_member_pattern("*.tar.gz!logs/*.log"))
+
+    def test_split_without_member_pattern(self):
+        self.assertEqual(("log[!0-9].txt", None), split_member_pattern("log[!0-9].txt"))
+        self.assertEqual(("warnings!", None), split_member_pattern("warnings!"))
+
+    def test_match_member(self):
+        self.assertTrue(match_member("**/*.xml", "report.xml"))
+        self.assertTrue(match_member("**/*.xml", "a/b/report.xml"))
+        self.assertTrue(match_member("a/**/*.xml", "a/report.xml"))
+        self.assertTrue(match_member("a/**", "a/b/report.xml"))
+        self.assertTrue(match_member("**", "report.xml"))
+
+    def test_no_match_member(self):
+        self.assertFalse(match_member("*.xml", "a/report.xml"))
+        self.assertFalse(match_member("a/**", "a"))
+        self.assertFalse(match_member("**/*.xml", "report.XML"))
+        self.assertFalse(match_member("b/**/*.xml", "a/b/report.xml"))
+
+    def test_logfile_part(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            plain = Path(tmp_dir, "build.log")
+            plain.write_bytes(b"first line\r\nsecond line\nthird line\n")
+            compressed = Path(tmp_dir, "build.log.gz")
+            compressed.write_bytes(gzip.compress(plain.read_bytes()))
+            self.assertTrue(is_plain_logfile(str(plain)))
+            self.assertFalse(is_plain_logfile(str(compressed)))
+            with open_logfile_part(str(plain), 12, 24) as file:
+                self.assertEqual("second line\n", file.read())
@@ -107,6 +107,28 @@ class TestConfig(TestCase):
         warnings.check(deprecation_warning)
         self.assertEqual(warnings.return_count(), 1)
 
+    def test_configfile_parsing_exclude_order(self):
+        warnings = WarningsPlugin()
+        tmpjson = {
+            "sphinx": {
+                "enabled": True,
+                "min": 0,
+                "max": 0,
+                "exclude": [
+                    "WARNING: toctree",
+                    "index.rst",
+                ]
+            }
+        }
+
+        warnings.config_parser(tmpjson, True, None)
+        toctree_warning = "/home/bljah/test/index.rst:5: WARNING: toctree contains reference to nonexisting document "\
+                          "u'installation'"
+        warnings.check(toctree_warning)
+        self.assertEqual(warnings.return_count(), 0)
+        self.assertIn(f"Excluded {toctree_warning!r} because of configured regex 'WARNING: toctree'",
+                      self.caplog.messages)
+
     def test_partial_sphinx_config_parsing(self):
         warnings = WarningsPlugin()
         tmpjson = {
@@ -0,0 +1,64 @@
+import os
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+from mlx.warnings.discovery import Logfile, discover_logfiles
+
+
+class TestDiscovery(TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp_dir.name)
+        for path, size in (("a.log", 3), ("b.log", 1), (".hidden.log", 2), ("sub/c.log", 5), ("sub/deep/d.log", 4),
+                           ("sub/.hidden/e.log", 6), ("sub/d.txt", 7)):
+            (self.root / path).parent.mkdir(parents=True, exist_ok=True)
+            (self.root / path).write_text("x" * size)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def path(self, *parts):
+        return os.path.join(self.tmp_dir.name, *parts)
+
+    def test_wildcard(self):
+        logfiles, missing = discover_logfiles([self.path("*.log")])
+        self.assertEqual([Logfile(self.path("a.log"), 3), Logfile(self.path("b.log"), 1)], logfiles)
+        self.assertIsNone(missing)
+
+    def test_recursive(self):
+        logfiles, _ = discover_logfiles([self.path("**", "*.log")])
+        self.assertEqual([self.path("a.log"), self.path("b.log"), self.path("sub", "c.log"),
+                          self.path("sub", "deep", "d.log")],
+                         [logfile.path for logfile in logfiles])
+
+    def test_hidden(self):
+        logfiles, _ = discover_logfiles([self.path(".*.log"), self.path("sub", ".*", "*")])
+        self.assertEqual([self.path(".hidden.log"), self.path("sub", ".hidden", "e.log")],
+                         [logfile.path for logfile in logfiles])
+
+    def test_duplicates(self):
+        logfiles, missing = discover_logfiles([self.path("sub", "c.log"), self.path("**", "*.log"),
+                                               self.path("sub", "..", "a.log")])
+        self.assertEqual([self.path("sub", "c.log"), self.path("a.log"), self.path("b.log"),
+                          self.path("sub", "deep", "d.log")],
+                         [logfile.path for logfile in logfiles])
+        self.assertIsNone(missing)
+
+    def test_directory_is_no_logfile(self):
+        logfiles, missing = discover_logfiles([self.path("*.log"), self.path("sub"), self.path("b.log")])
+        self.assertEqual([self.path("a.log"), self.path("b.log")], [logfile.path for logfile in logfiles])
+        self.assertEqual(self.path("sub"), missing)
+
+    def test_missing(self):
+        logfiles, missing = discover_logfiles([self.path("sub", "*.txt"), self.path("*.xml"), self.path("a.log")])
+        self.assertEqual([Logfile(self.path("sub", "d.txt"), 7)], logfiles)
+        self.assertEqual(self.path("*.xml"), missing)
+
+    def test_archive_members(self):
+        (self.root / "artifacts.zip").write_bytes(b"PK\x05\x06" + bytes(18))
+        logfiles, missing = discover_logfiles([self.path("*.zip!**/*.xml"), self.path("artifacts.zip!*.log")])
+        self.assertEqual([Logfile(self.path("artifacts.zip"), 22, "**/*.xml"),
+                          Logfile(self.path("artifacts.zip"), 22, "*.log")], logfiles)
+        self.assertIsNone(missing)
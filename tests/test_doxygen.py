@@ -1,8 +1,11 @@
+import glob
+import random
 from unittest import TestCase
 
 import pytest
 
 from mlx.warnings import WarningsPlugin
+from mlx.warnings.regex_checker import DoxygenPattern, doxy_bytes_pattern, doxy_pattern
 
 
 class TestDoxygenWarnings(TestCase):
@@ -78,3 +81,36 @@ class TestDoxygenWarnings(TestCase):
         with open(dut_file) as open_file:
             self.warnings.check(open_file.read())
         self.assertEqual(self.warnings.return_count(), 22)
+
+    def test_long_line(self):
+        dut = "ab:1:" * 200000 + "<a>:1 " * 200000 + "x" + " " * 1000000 + "warning\n"
+        dut += "testfile.c:6: warning: group test: ignoring title\n"
+        self.warnings.check(dut)
+        self.assertEqual(self.warnings.return_count(), 1)
+        self.assertEqual(["testfile.c:6: warning: group test: ignoring title"], self.caplog.messages)
+
+
+class TestDoxygenPattern(TestCase):
+    def assertSameMatches(self, content, *args):
+        pattern, reference = (DoxygenPattern(), doxy_pattern) if isinstance(content, str) else \
+            (DoxygenPattern(bytes_pattern=True), doxy_bytes_pattern)
+        self.assertEqual([(match.span(), match.groupdict()) for match in reference.finditer(content, *args)],
+                         [(match.span(), match.groupdict()) for match in pattern.finditer(content, *args)])
+
+    def test_test_files(self):
+        for path in glob.glob("tests/test_in/*.txt"):
+            with open(path, encoding="utf-8") as open_file:
+                content = open_file.read()
+            self.assertSameMatches(content)
+            self.assertSameMatches(content.encode())
+
+    def test_random_content(self):
+        pieces = ["a", "/", ".", "<", ">", ":", "1", "-2", " ", "\t", "\n", "warning", "Error", "notice", ": ",
+                  "notes", "<t>", ":12:", ":3: warning: ", ">:4: error: ", " warning: notes", "file.c", "\u2003"]
+        rand = random.Random(0)
+        for _ in range(2000):
+            content = "".join(rand.choice(pieces) for _ in range(rand.randint(0, 30)))
+            pos = rand.randint(0, len(content))
+            endpos = rand.randint(pos, len(content))
+            self.assertSameMatches(content, pos, endpos)
+            self.assertSameMatches(content.encode(), pos, endpos)
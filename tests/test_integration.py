@@ -1,13 +1,28 @@
+import bz2
+import codecs
 import filecmp
+import gzip
+import locale
 import logging
+import lzma
 import os
+import subprocess
+import sys
+import tarfile
+import threading
+import time
+import zipfile
 from pathlib import Path
 from unittest import TestCase
 from unittest.mock import patch
 
 import pytest
 
-from mlx.warnings import Finding, WarningsConfigError, exceptions, warnings_wrapper
+from mlx.warnings import Finding, WarningsConfigError, WarningsPlugin, exceptions, warnings_wrapper
+from mlx.warnings.discovery import Logfile
+from mlx.warnings.archives import iter_logfile_contents
+from mlx.warnings.parallel import read_shared_content, split_logfiles
+from mlx.warnings.warnings import terminate_process_group
 
 TEST_IN_DIR = Path(__file__).parent / "test_in"
 TEST_OUT_DIR = Path(__file__).parent / "test_out"
@@ -86,6 +101,41 @@ class TestIntegration(TestCase):
         retval = warnings_wrapper(["--junit", "tests/test_in/junit_single_fail.xml"])
         self.assertEqual(1, retval)
 
+    def test_compressed_arguments(self):
+        logfiles = []
+        for module in (bz2, gzip, lzma):
+            path = TEST_OUT_DIR / f"junit_double_fail.xml.{module.__name__}"
+            path.write_bytes(module.compress((TEST_IN_DIR / "junit_double_fail.xml").read_bytes()))
+            logfiles.append(str(path))
+        retval = warnings_wrapper(["--junit", *logfiles])
+        self.assertEqual(6, retval)
+
+    def test_archive_members(self):
+        archive_path = TEST_OUT_DIR / "junit_reports.zip"
+        with zipfile.ZipFile(archive_path, "w") as archive:
+            archive.write(TEST_IN_DIR / "junit_double_fail.xml", "reports/junit_double_fail.xml")
+            archive.write(TEST_IN_DIR / "junit_single_fail.xml", "reports/nested/junit_single_fail.xml")
+            archive.write(TEST_IN_DIR / "sphinx_double_warning.txt", "sphinx_double_warning.txt")
+        retval = warnings_wrapper(["--junit", f"{archive_path}!**/*.xml"])
+        self.assertEqual(3, retval)
+
+    def test_compressed_tar_archive(self):
+        archive_path = TEST_OUT_DIR / "logs.tar.gz"
+        with tarfile.open(archive_path, "w:gz") as archive:
+            archive.add(TEST_IN_DIR / "sphinx_double_warning.txt", "sphinx_double_warning.txt")
+            archive.add(TEST_IN_DIR / "sphinx_single_warning.txt", "logs/sphinx_single_warning.txt")
+        retval = warnings_wrapper(["--sphinx", str(archive_path)])
+        self.assertEqual(3, retval)
+
+    def test_archive_without_matching_members(self):
+        archive_path = TEST_OUT_DIR / "junit_reports.tar"
+        with tarfile.open(archive_path, "w") as archive:
+            archive.add(TEST_IN_DIR / "junit_double_fail.xml", "junit_double_fail.xml")
+        with self.assertLogs(level="ERROR") as cm:
+            retval = warnings_wrapper(["--junit", f"{archive_path}!*.log"])
+        self.assertEqual(1, retval)
+        self.assertEqual([f"ERROR:mlx.warnings.warnings:FILE: {archive_path}!*.log does not exist"], cm.output)
+
     def test_single_defect_coverity(self):
         retval = warnings_wrapper(["--coverity", "tests/test_in/coverity_single_defect.txt"])
         self.assertEqual(1, retval)
@@ -185,6 +235,138 @@ class TestIntegration(TestCase):
         retval = warnings_wrapper(["--sphinx", "--command", "cat", "tests/test_in/sphinx_single_warning.txt", ">&2"])
         self.assertEqual(1, retval)
 
+    def test_command_stdout_and_stderr(self):
+        retval = warnings_wrapper(["--sphinx", "--command", "sh", "-c",
+                                   "cat tests/test_in/sphinx_single_warning.txt; "
+                                   "cat tests/test_in/sphinx_double_warning.txt >&2"])
+        self.assertEqual(1 + 2, retval)
+
+    def test_command_interleaved_streams(self):
+        out_file = TEST_OUT_DIR / "interleaved_streams.txt"
+        script = ("import sys, time; print('index.rst:5:', flush=True); time.sleep(0.2); "
+                  "print('building [html]', file=sys.stderr, flush=True); time.sleep(0.2); "
+                  "print('WARNING: toctree contains reference to nonexisting document', flush=True)")
+        retval = warnings_wrapper(["--sphinx", "-o", str(out_file), "--command", sys.executable, "-c", script])
+        self.assertEqual(1, retval)
+        self.assertEqual("Sphinx: index.rst:5:\nWARNING: toctree contains reference to nonexisting document\n",
+                         out_file.read_text())
+
+    def test_command_junit_with_stderr(self):
+        retval = warnings_wrapper(["--junit", "--command", "sh", "-c",
+                                   "cat tests/test_in/junit_double_fail.xml; echo 'some noise' >&2"])
+        self.assertEqual(2, retval)
+
+    def test_command_printout(self):
+        retval = warnings_wrapper(["--sphinx", "--command", "cat", "tests/test_in/sphinx_single_warning.txt"])
+        self.assertEqual(1, retval)
+        with open("tests/test_in/sphinx_single_warning.txt") as logfile:
+            expected_lines = logfile.read().splitlines()
+        self.assertEqual(expected_lines, self.stderr_lines[:len(expected_lines)])
+
+    def test_follow_until_sentinel(self):
+        logfile = TEST_OUT_DIR / "follow_sentinel.log"
+        logfile.write_text("")
+        content = (TEST_IN_DIR / "sphinx_double_warning.txt").read_text()
+
+        def write_log():
+            for _ in range(2):
+                time.sleep(0.1)
+                with open(logfile, "a") as file:
+                    file.write(content)
+            with open(logfile, "a") as file:
+                file.write(f"BUILD FINISHED\n{content}")
+
+        writer = threading.Thread(target=write_log)
+        writer.start()
+        retval = warnings_wrapper(["--sphinx", "--maxwarnings", "10", "--follow", "--follow-until", "BUILD FINISHED",
+                                   str(logfile)])
+        writer.join()
+        self.assertEqual(0, retval)
+        self.assertIn("Sphinx: number of warnings (4) is between limits 0 and 10. Well done.", self.stderr_lines)
+
+    @pytest.mark.skipif(codecs.lookup(locale.getpreferredencoding(False)).name != "utf-8",
+                        reason="writes UTF-8 encoded content")
+    def test_follow_split_character(self):
+        logfile = TEST_OUT_DIR / "follow_split.log"
+        out_file = TEST_OUT_DIR / "follow_split_output.txt"
+        logfile.write_bytes(b"index.rst:5: WARNING: unknown document: caf\xc3")
+
+        def write_log():
+            time.sleep(0.3)
+            with open(logfile, "ab") as file:
+                file.write(b"\xa9\r")
+            time.sleep(0.3)
+            with open(logfile, "ab") as file:
+                file.write(b"\nBUILD FINISHED\n")
+
+        writer = threading.Thread(target=write_log)
+        writer.start()
+        retval = warnings_wrapper(["--sphinx", "--follow", "--follow-until", "BUILD FINISHED", "-o", str(out_file),
+                                   str(logfile)])
+        writer.join()
+        self.assertEqual(1, retval)
+        self.assertEqual("Sphinx: index.rst:5: WARNING: unknown document: caf\u00e9\n", out_file.read_text(encoding="utf-8"))
+
+    def test_follow_maximum_exceeded(self):
+        retval = warnings_wrapper(["--doxygen", "--maxwarnings", "2", "--follow", "tests/test_in/doxygen_warnings.txt"])
+        self.assertEqual(22, retval)
+
+    def test_follow_writer_ended(self):
+        writer = subprocess.Popen([sys.executable, "-c", "pass"])
+        writer.wait()
+        retval = warnings_wrapper(["--sphinx", "--maxwarnings", "10", "--follow", "--follow-pid", str(writer.pid),
+                                   "tests/test_in/sphinx_double_warning.txt"])
+        self.assertEqual(0, retval)
+        self.assertEqual(["Sphinx: number of warnings so far: 2",
+                          "Sphinx: number of warnings (2) is between limits 0 and 10. Well done."],
+                         self.stderr_lines)
+
+    def test_follow_junit(self):
+        writer = subprocess.Popen([sys.executable, "-c", "pass"])
+        writer.wait()
+        retval = warnings_wrapper(["--junit", "--follow", "--follow-pid", str(writer.pid),
+                                   "tests/test_in/junit_double_fail.xml"])
+        self.assertEqual(2, retval)
+        self.assertEqual(["JUnit: number of warnings (2) is higher than the maximum limit (0). Returning error code 2."],
+                         self.stderr_lines)
+
+    def test_follow_multiple_logfiles(self):
+        retval = warnings_wrapper(["--sphinx", "--follow", "tests/test_in/sphinx_*_warning.txt"])
+        self.assertEqual(1, retval)
+
+    def test_command_abort(self):
+        script = ("import sys, time; print(open(sys.argv[1]).read() + 'Building...\\nStill building...', flush=True); "
+                  "time.sleep(60); print(open(sys.argv[1]).read())")
+        start = time.monotonic()
+        retval = warnings_wrapper(["--sphinx", "--abort-command", "--command", sys.executable, "-c", script,
+                                   "tests/test_in/sphinx_double_warning.txt"])
+        self.assertLess(time.monotonic() - start, 30)
+        self.assertEqual(2, retval)
+        self.assertIn("Terminating the command because the maximum amount of warnings is exceeded", self.stderr_lines)
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="process groups are specific to POSIX")
+    def test_terminate_process_group(self):
+        child = ("import signal, sys, time\n"
+                 "def stop(*args):\n    time.sleep(0.5)\n    open(sys.argv[1], 'w').close()\n    sys.exit(0)\n"
+                 "signal.signal(signal.SIGTERM, stop)\nprint('ready', flush=True)\ntime.sleep(60)")
+        leader = "import subprocess, sys, time; subprocess.Popen([sys.executable, '-c', *sys.argv[1:]]); time.sleep(60)"
+        marker = TEST_OUT_DIR / "terminated_child.txt"
+        marker.unlink(missing_ok=True)
+        proc = subprocess.Popen([sys.executable, "-c", leader, child, str(marker)], stdout=subprocess.PIPE, text=True,
+                                start_new_session=True)
+        with proc.stdout:
+            self.assertEqual("ready\n", proc.stdout.readline())
+            start = time.monotonic()
+            terminate_process_group(proc, grace_period=20)
+        # the child that outlives the leader gets the time to end by itself, without waiting for the whole period
+        self.assertTrue(marker.exists())
+        self.assertLess(time.monotonic() - start, 10)
+
+    def test_command_abort_within_limits(self):
+        retval = warnings_wrapper(["--sphinx", "--maxwarnings", "2", "--abort-command", "--command", "cat",
+                                   "tests/test_in/sphinx_double_warning.txt"])
+        self.assertEqual(0, retval)
+
     def test_faulty_command(self):
         with self.assertRaises(OSError):
             warnings_wrapper(["--sphinx", "--command", "blahahahaha", "tests/test_in/sphinx_single_warning.txt"])
@@ -202,6 +384,114 @@ class TestIntegration(TestCase):
         retval = warnings_wrapper(["--junit", "tests/test_in/junit*.xml"])
         self.assertEqual(self.junit_warning_cnt, retval)
 
+    def test_wildcarded_arguments_jobs(self):
+        retval = warnings_wrapper(["--junit", "--jobs", "2", "tests/test_in/junit*.xml"])
+        self.assertEqual(self.junit_warning_cnt, retval)
+
+    def test_output_jobs(self):
+        out_file_serial = str(TEST_OUT_DIR / "serial_output.txt")
+        out_file_jobs = str(TEST_OUT_DIR / "jobs_output.txt")
+        logfiles = ["tests/test_in/sphinx_double_warning.txt", "tests/test_in/doxygen_warnings.txt",
+                    "tests/test_in/sphinx_single_warning.txt"]
+        retval_serial = warnings_wrapper(["--sphinx", "--doxygen", "-o", out_file_serial, *logfiles])
+        reset_logging()
+        retval_jobs = warnings_wrapper(["--sphinx", "--doxygen", "--jobs", "3", "-o", out_file_jobs, *logfiles])
+        self.assertEqual(retval_serial, retval_jobs)
+        self.assertTrue(filecmp.cmp(out_file_serial, out_file_jobs, shallow=False))
+
+    def test_output_jobs_logfile_parts(self):
+        filler = "".join(f"[{index:3d}%] Building CXX object src/module{index}.cpp.o\n" for index in range(0, 100, 5))
+        logfile = TEST_OUT_DIR / "large_logfile.txt"
+        logfile.write_text("".join(filler + (TEST_IN_DIR / name).read_text()
+                                   for name in ("doxygen_warnings.txt", "sphinx_double_warning.txt",
+                                                "mixed_warnings.txt") * 4))
+        out_file_serial = str(TEST_OUT_DIR / "serial_parts_output.txt")
+        out_file_jobs = str(TEST_OUT_DIR / "jobs_parts_output.txt")
+        retval_serial = warnings_wrapper(["--sphinx", "--doxygen", "-o", out_file_serial, str(logfile)])
+        reset_logging()
+        with patch("mlx.warnings.parallel.PART_SIZE", 2 ** 12):
+            warnings = WarningsPlugin()
+            warnings.activate_checker_name("sphinx", False, None)
+            warnings.activate_checker_name("doxygen", False, None)
+            parts = split_logfiles(warnings, [Logfile(str(logfile), logfile.stat().st_size)], 4)
+            self.assertEqual(4, len(parts))
+            self.assertEqual([0, *[part.end for part in parts]], [part.start for part in parts] + [parts[-1].end])
+            reset_logging()
+            retval_jobs = warnings_wrapper(["--sphinx", "--doxygen", "--jobs", "4", "-o", out_file_jobs, str(logfile)])
+        self.assertEqual(retval_serial, retval_jobs)
+        # the warnings of different checkers can be interleaved differently, like when the chunk size differs
+        with open(out_file_serial) as serial, open(out_file_jobs) as jobs:
+            serial_lines, jobs_lines = serial.readlines(), jobs.readlines()
+        for prefix in ("Sphinx: ", "Doxygen: "):
+            self.assertEqual([line for line in serial_lines if line.startswith(prefix)],
+                             [line for line in jobs_lines if line.startswith(prefix)])
+
+    def test_output_jobs_per_checker(self):
+        archive_path = TEST_OUT_DIR / "mixed_logs.tar.gz"
+        with tarfile.open(archive_path, "w:gz") as archive:
+            archive.add(TEST_IN_DIR / "mixed_warnings.txt", "mixed_warnings.txt")
+            archive.add(TEST_IN_DIR / "doxygen_warnings.txt", "logs/doxygen_warnings.txt")
+        out_file_serial = str(TEST_OUT_DIR / "serial_checkers_output.txt")
+        out_file_jobs = str(TEST_OUT_DIR / "jobs_checkers_output.txt")
+        args = ["--sphinx", "--doxygen", "--xmlrunner", str(archive_path)]
+        retval_serial = warnings_wrapper(["-o", out_file_serial, *args])
+        reset_logging()
+        retval_jobs = warnings_wrapper(["--jobs", "3", "-o", out_file_jobs, *args])
+        self.assertEqual(retval_serial, retval_jobs)
+        with open(out_file_serial) as serial, open(out_file_jobs) as jobs:
+            serial_lines, jobs_lines = serial.readlines(), jobs.readlines()
+        self.assertEqual(sorted(serial_lines), sorted(jobs_lines))
+        for prefix in ("Sphinx: ", "Doxygen: ", "Xmlrunner: "):
+            self.assertEqual([line for line in serial_lines if line.startswith(prefix)],
+                             [line for line in jobs_lines if line.startswith(prefix)])
+        reset_logging()
+        with self.assertLogs(level="ERROR") as cm:
+            retval = warnings_wrapper(["--sphinx", "--doxygen", "--jobs", "2", f"{archive_path}!*.log"])
+        self.assertEqual(1, retval)
+        self.assertEqual([f"ERROR:mlx.warnings.warnings:FILE: {archive_path}!*.log does not exist"], cm.output)
+
+    def test_read_shared_content(self):
+        content = (TEST_IN_DIR / "doxygen_warnings.txt").read_bytes()
+        compressed_path = TEST_OUT_DIR / "doxygen_warnings.txt.gz"
+        compressed_path.write_bytes(gzip.compress(content))
+        for path, size in ((TEST_IN_DIR / "doxygen_warnings.txt", len(content)), (compressed_path, 100)):
+            for file in iter_logfile_contents(path):
+                shared, amount = read_shared_content(file, size)
+                try:
+                    self.assertEqual(content, bytes(shared.buf[:amount]))
+                    if path == compressed_path:
+                        self.assertGreater(shared.size, len(content))
+                    else:
+                        self.assertLess(shared.size, 2 * len(content))  # sized from the start, not grown
+                finally:
+                    shared.close()
+                    shared.unlink()
+
+    def test_strip_timestamps(self):
+        lines = (TEST_IN_DIR / "sphinx_double_warning.txt").read_text().splitlines(keepends=True)
+        logfile = TEST_OUT_DIR / "sphinx_double_warning_timestamps.txt"
+        logfile.write_text("".join(f"2024-05-22T12:43:46.{index:06d}Z 00O {line}" for index, line in enumerate(lines)))
+        out_file_reference = str(TEST_OUT_DIR / "reference_output.txt")
+        out_file_stripped = str(TEST_OUT_DIR / "stripped_output.txt")
+        retval_reference = warnings_wrapper(["--sphinx", "-o", out_file_reference,
+                                             str(TEST_IN_DIR / "sphinx_double_warning.txt")])
+        reset_logging()
+        retval_stripped = warnings_wrapper(["--sphinx", "--strip-timestamps", "-o", out_file_stripped, str(logfile)])
+        self.assertEqual(retval_reference, retval_stripped)
+        self.assertTrue(filecmp.cmp(out_file_reference, out_file_stripped, shallow=False))
+
+    def test_fail_fast(self):
+        retval = warnings_wrapper(["--junit", "--fail-fast", "tests/test_in/junit*.xml"])
+        self.assertEqual(2, retval)
+        self.assertIn("Stopped parsing because the maximum limit of each checker is exceeded: the amounts of warnings "
+                      "are lower bounds", self.stderr_lines)
+
+    def test_fail_fast_output(self):
+        with self.assertRaises(SystemExit) as cm:
+            warnings_wrapper(["--junit", "--fail-fast", "-o", str(TEST_OUT_DIR / "fail_fast.txt"),
+                              "tests/test_in/junit*.xml"])
+        self.assertEqual(2, cm.exception.code)
+
     def test_max(self):
         retval = warnings_wrapper(["--junit", "--maxwarnings", "2", "tests/test_in/junit*.xml"])
         self.assertEqual(self.junit_warning_cnt, retval)
@@ -408,6 +698,22 @@ class TestIntegration(TestCase):
             self.stderr_lines)
         self.assertEqual(cm_err.exception.code, -1)
 
+    def test_robot_config_check_name_jobs(self):
+        args = ["--verbose", "--config", "tests/test_in/config_example_robot_invalid_suite.json",
+                "tests/test_in/robot_double_fail.xml", "tests/test_in/robot_nested_suite.xml"]
+        stderr_lines = []
+        for jobs in ("1", "2"):
+            reset_logging()
+            with self.assertRaises(SystemExit) as cm_err:
+                warnings_wrapper(["--jobs", jobs, *args])
+            self.assertEqual(cm_err.exception.code, -1)
+            stderr_lines.append(self.stderr_lines)
+        # the test cases of the first logfile are logged before the missing suite name ends the program
+        self.assertEqual(stderr_lines[0], stderr_lines[1])
+        self.assertEqual("Robot: suite 'b4d su1te name' No suite with name 'b4d su1te name' found. Returning error "
+                         "code -1.", stderr_lines[1][-1])
+        self.assertEqual(5, len(stderr_lines[1]))
+
     def test_robot_cli_check_name(self):
         self.maxDiff = None
         with self.assertRaises(SystemExit) as cm_err:
@@ -668,6 +974,14 @@ class TestIntegration(TestCase):
                           "Low\\tdummy_function()\\tdummy_file_name.c\\tUnreviewed\\tUnset\\t\\t"
                           "070C1B448A0522F568D3224568\\t25\\t7' because of configured regex "
                           "'.+\\\\tdummy_function\\\\(\\\\)\\\\tdummy_file_name\\\\.c\\\\t'",
+                          "Polyspace: run-time check  : color       : orange         | exclusion cache: 0 hits and 3 "
+                          "misses (0.0% hit rate)",
+                          "Polyspace: defect          : information : impact: high   | exclusion cache: 0 hits and 2 "
+                          "misses (0.0% hit rate)",
+                          "Polyspace: defect          : information : impact: medium | exclusion cache: 0 hits and 2 "
+                          "misses (0.0% hit rate)",
+                          "Polyspace: defect          : information : impact: low    | exclusion cache: 0 hits and 2 "
+                          "misses (0.0% hit rate)",
                           "Polyspace: run-time check  : color       : red            | number of warnings (0) is "
                           "exactly as expected. Well done.",
                           "Polyspace: run-time check  : color       : orange         | number of warnings (0) is "
@@ -1,3 +1,5 @@
+import tempfile
+from pathlib import Path
 from unittest import TestCase
 
 import pytest
@@ -36,3 +38,89 @@ class TestJUnitFailures(TestCase):
     def test_invalid_xml(self):
         self.warnings.check("this is not xml")
         self.assertEqual(self.warnings.return_count(), 0)
+
+    def test_nested_suites_in_chunks(self):
+        content = ('<testsuites><testsuite name="outer"><testcase classname="outer" name="first">'
+                   '<failure message="first failure"/></testcase><testsuite name="inner">'
+                   '<testcase classname="inner" name="second"><error message="second error"/></testcase>'
+                   '<testcase classname="inner" name="third"><failure message="excluded failure"/></testcase>'
+                   '</testsuite></testsuite></testsuites>')
+        checker = self.warnings.get_checker("junit")
+        checker.add_patterns(["excluded"], checker.exclude_patterns)
+        for index in range(0, len(content), 7):
+            checker.feed(content[index:index + 7])
+        checker.flush()
+        # only the failures of the top-level suite are counted, minus the excluded ones of all suites
+        self.assertEqual(self.warnings.return_count(), 0)
+        self.assertEqual(["outer.first", "inner.second",
+                          "Excluded 'excluded failure' because of configured regex 'excluded'"],
+                         self.caplog.messages)
+
+    def test_mixed_root_without_message(self):
+        checker = self.warnings.get_checker("junit")
+        checker.add_patterns(["excluded"], checker.exclude_patterns)
+        self.warnings.check('<testsuites><testsuite name="suite">'
+                            '<testcase classname="suite" name="first"><failure/></testcase>'
+                            '<testcase classname="suite" name="second"><failure message="excluded"/></testcase>'
+                            '</testsuite><testcase classname="root" name="third"><error/></testcase></testsuites>')
+        # test cases outside of a test suite make junitparser count nothing
+        self.assertEqual(self.warnings.return_count(), 0)
+        self.assertEqual([], self.caplog.messages)
+        self.warnings.check('<testsuites><testsuite name="suite">'
+                            '<testcase classname="suite" name="first"><failure/></testcase>'
+                            '<testcase classname="suite" name="second"><failure message="excluded"/></testcase>'
+                            '</testsuite></testsuites>')
+        self.assertEqual(self.warnings.return_count(), 1)
+        self.assertEqual(["suite.first", "Excluded 'excluded' because of configured regex 'excluded'"],
+                         self.caplog.messages)
+
+    def test_suite_attributes(self):
+        self.warnings.check('<testsuite failures="3" errors="1"><testsuite name="inner">'
+                            '<testcase classname="inner" name="first"><failure message="failure"/></testcase>'
+                            '</testsuite></testsuite>')
+        self.assertEqual(self.warnings.return_count(), 4)
+
+    def test_counts_only(self):
+        content = ('<testsuites><testsuite name="outer">'
+                   '<testcase classname="outer" name="first"><failure message="failure"/></testcase>'
+                   '<testcase classname="outer" name="second"><error message="error"/></testcase>'
+                   '<testsuite name="inner"><testcase classname="inner" name="third"><failure/></testcase></testsuite>'
+                   '<testcase classname="outer" name="fourth"><skipped/></testcase>'
+                   '</testsuite></testsuites>').encode()
+        self.assertFalse(self.warnings.get_checker("junit").counts_only)
+        self.warnings.check(content)
+        warnings = WarningsPlugin()
+        checker = warnings.activate_checker_name("junit", False, None)
+        self.assertTrue(checker.counts_only)
+        for index in range(0, len(content), 5):
+            checker.feed(content[index:index + 5])
+        checker.flush()
+        self.assertEqual(2, self.warnings.return_count())
+        self.assertEqual(self.warnings.return_count(), warnings.return_count())
+        checker.add_patterns(["error"], checker.exclude_patterns)
+        self.assertFalse(checker.counts_only)
+
+    def test_invalid_xml_in_chunks(self):
+        checker = self.warnings.get_checker("junit")
+        for chunk in ("<testsuite>", "<testcase>", "</testsuite>", "<testsuite/>"):
+            checker.feed(chunk)
+        checker.flush()
+        self.assertEqual(self.warnings.return_count(), 0)
+        self.assertEqual(1, len(self.caplog.records))
+        self.assertEqual("ERROR", self.caplog.records[0].levelname)
+
+    def test_declared_encoding(self):
+        content = ('<?xml version="1.0" encoding="ISO-8859-1"?>\n<testsuite><testcase classname="caf\u00e9" name="test">'
+                   '<failure message="na\u00efve failure"/></testcase></testsuite>')
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir, "junit_latin1.xml")
+            path.write_bytes(content.encode("iso-8859-1"))
+            for names in (("junit",), ("junit", "sphinx")):
+                self.caplog.clear()
+                warnings = WarningsPlugin()
+                for name in names:
+                    warnings.activate_checker_name(name, True, None)
+                with open(path, encoding="iso-8859-1") as xmlfile:
+                    warnings.check_logfile(xmlfile)
+                self.assertEqual(1, warnings.return_count())
+                self.assertEqual(["caf\u00e9.test"], self.caplog.messages)
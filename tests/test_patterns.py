@@ -0,0 +1,87 @@
+import copy
+import pickle
+import re
+from unittest import TestCase
+
+from mlx.warnings.patterns import PatternList
+from mlx.warnings.regex_engines import RegexEngine
+
+
+class SpyPattern:
+    """Compiled regex that counts how often it is searched on its own"""
+
+    def __init__(self, regex):
+        self._pattern = re.compile(regex)
+        self.calls = 0
+
+    def __getattr__(self, name):
+        return getattr(self._pattern, name)
+
+    def search(self, content):
+        self.calls += 1
+        return self._pattern.search(content)
+
+
+class SpyEngine(RegexEngine):
+    """Engine that combines spy patterns with each other"""
+
+    def is_native(self, pattern):
+        return isinstance(pattern, SpyPattern)
+
+
+class TestPatternList(TestCase):
+
+    def test_no_patterns(self):
+        self.assertIsNone(PatternList().search("anything"))
+
+    def test_matching_pattern(self):
+        regexes = [r"src/.*\.h:\d+", r"unused variable 'tmp\d*'", "deprecated", "deprecation", r"^\s*note: "]
+        patterns = PatternList(re.compile(regex) for regex in regexes)
+        self.assertEqual(r"src/.*\.h:\d+", patterns.search("src/module/a.h:12: warning: deprecated"))
+        self.assertEqual("deprecated", patterns.search("lib.c:3: warning: deprecated"))
+        self.assertEqual("deprecation", patterns.search("lib.c:3: warning: deprecation"))
+        self.assertEqual(r"unused variable 'tmp\d*'", patterns.search("lib.c:4: warning: unused variable 'tmp12'"))
+        self.assertEqual(r"^\s*note: ", patterns.search("  note: declared here"))
+        self.assertIsNone(patterns.search("lib.c:5: warning: unused variable 'x'"))
+
+    def test_first_pattern_in_order(self):
+        regexes = [r"warning: \w+", r"(?i)LIB\.c", "lib", r"a\.c"]
+        patterns = PatternList(re.compile(regex) for regex in regexes)
+        self.assertEqual(r"warning: \w+", patterns.search("lib.c:3: warning: deprecated"))
+        self.assertEqual(r"(?i)LIB\.c", patterns.search("lib.c:3: note: declared here"))
+        self.assertEqual("lib", patterns.search("lib.h:3: note: declared here"))
+        self.assertEqual(r"a\.c", patterns.search("a.c:3: note: declared here"))
+
+    def test_hit_skips_later_patterns(self):
+        spies = [SpyPattern(regex) for regex in ("lib", r"a\.c", "note", r"\d+")]
+        patterns = PatternList(spies, engine=SpyEngine())
+        self.assertEqual(r"a\.c", patterns.search("a.c:3: note: declared here"))
+        self.assertEqual([1, 0, 0, 0], [spy.calls for spy in spies])
+        self.assertEqual("lib", patterns.search("a.c:3: note: declared in lib.h"))
+        self.assertEqual([2, 0, 0, 0], [spy.calls for spy in spies])
+        self.assertIsNone(patterns.search("warning"))
+        self.assertEqual([2, 0, 0, 0], [spy.calls for spy in spies])
+
+    def test_regexes_that_cannot_be_combined(self):
+        regexes = [r"(\w+) is \1", r"(?P<name>\w+)\.h", "(?i)toctree", r"foo|bar", r"(?x) z \| y  # comment"]
+        patterns = PatternList(re.compile(regex) for regex in regexes)
+        self.assertEqual(r"(\w+) is \1", patterns.search("x is x"))
+        self.assertIsNone(patterns.search("x is y"))
+        self.assertEqual(r"(?P<name>\w+)\.h", patterns.search("a.h"))
+        self.assertEqual("(?i)toctree", patterns.search("TocTree"))
+        self.assertEqual(r"foo|bar", patterns.search("a bar"))
+        self.assertEqual(r"(?x) z \| y  # comment", patterns.search("z|y"))
+
+    def test_append(self):
+        patterns = PatternList()
+        self.assertIsNone(patterns.search("abc"))
+        patterns.append(re.compile("b"))
+        self.assertEqual("b", patterns.search("abc"))
+        self.assertEqual(["b"], [pattern.pattern for pattern in patterns])
+
+    def test_copy(self):
+        patterns = PatternList([re.compile("a[bc]")])
+        self.assertEqual("a[bc]", patterns.search("xac"))
+        for duplicate in (copy.deepcopy(patterns), pickle.loads(pickle.dumps(patterns))):
+            self.assertEqual("a[bc]", duplicate.search("xab"))
+            self.assertEqual(1, len(duplicate))
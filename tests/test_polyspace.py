@@ -1,5 +1,7 @@
 import filecmp
+import lzma
 import os
+import tempfile
 import unittest
 from pathlib import Path
 
@@ -42,6 +44,15 @@ class TestCodeProverWarnings(unittest.TestCase):
         )
         self.assertEqual(count, 19)
 
+    def test_code_prover_tsv_file_compressed(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "polyspace.tsv.xz"
+            path.write_bytes(lzma.compress((TEST_IN_DIR / "polyspace.tsv").read_bytes()))
+            with open(path, newline="") as file:
+                self.warnings.check_logfile(file)
+        count = self.warnings.return_check_limits()
+        self.assertEqual(count, 19)
+
 
 class TestBugFinderWarnings(unittest.TestCase):
     @pytest.fixture(autouse=True)
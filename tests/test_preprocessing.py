@@ -0,0 +1,73 @@
+from unittest import TestCase
+
+import pytest
+
+from mlx.warnings import WarningsPlugin
+from mlx.warnings.preprocessing import Preprocessor
+
+
+class TestPreprocessing(TestCase):
+    @pytest.fixture(autouse=True)
+    def caplog(self, caplog):
+        self.caplog = caplog
+
+    def test_no_escape_character(self):
+        content = "index.rst:5: WARNING: toctree contains a reference\n"
+        self.assertIs(content, Preprocessor()(content))
+
+    def test_strip_ansi(self):
+        preprocessor = Preprocessor()
+        self.assertEqual("index.rst:5: WARNING: toctree\n",
+                         preprocessor("\x1b[31mindex.rst:5: \x1b[1;33mWARNING\x1b[0m: toctree\n"))
+        preprocessor.strip_ansi = False
+        self.assertEqual("\x1b[31mWARNING\n", preprocessor("\x1b[31mWARNING\n"))
+
+    def test_strip_timestamps(self):
+        preprocessor = Preprocessor(strip_timestamps=True)
+        self.assertEqual("index.rst:5: WARNING: toctree\nbuild finished\n",
+                         preprocessor("2024-05-22T12:43:46.962646Z 00O index.rst:5: WARNING: toctree\n"
+                                      "2024-05-22T12:43:47.000001Z 00O+build finished\n"))
+        self.assertEqual("index.rst:5: WARNING: toctree\nbuild finished\n",
+                         preprocessor("[2024-05-22T12:43:46.962Z] index.rst:5: WARNING: toctree\n"
+                                      "[12:43:47] build finished\n"))
+        self.assertEqual("index.rst:5: WARNING: toctree [12:43:47]\n",
+                         preprocessor("\x1b[32m[12:43:46] \x1b[0mindex.rst:5: WARNING: toctree [12:43:47]\n"))
+
+    def test_max_line_length(self):
+        preprocessor = Preprocessor(max_line_length=12)
+        self.assertEqual("warning: a\n\nwarning: b", preprocessor("warning: a\nwarning: long\nwarning: b"))
+        self.assertEqual("\x1b[1mwarning: ", preprocessor.limit_partial_line("\x1b[1mwarning: long line"))
+        self.assertEqual("warning", preprocessor.limit_partial_line("warning"))
+
+    def test_skip_long_lines(self):
+        warnings = WarningsPlugin()
+        warnings.preprocessor.max_line_length = 100
+        warnings.activate_checker_name("doxygen", True, None)
+        warnings.feed("testfile.c:6: warning: long line " + "x" * 200)
+        warnings.feed("x" * 200 + "\ntestfile.c:7: warning: short line\n")
+        warnings.flush()
+        self.assertEqual(1, warnings.return_count())
+        self.assertEqual(["testfile.c:7: warning: short line"], self.caplog.messages)
+
+    def test_sphinx_warning_with_timestamps(self):
+        content = ("2024-05-22T12:43:46.962646Z 00O \x1b[91mdoc/index.rst:5: WARNING: toctree contains "
+                   "reference to nonexisting document 'installation'\x1b[39;49;00m\n")
+        warnings = WarningsPlugin(cq_enabled=True)
+        warnings.preprocessor.strip_timestamps = True
+        warnings.activate_checker_name("sphinx", True, None)
+        warnings.check(content)
+        self.assertEqual(1, warnings.return_count())
+        self.assertEqual(["doc/index.rst:5: WARNING: toctree contains reference to nonexisting document "
+                          "'installation'"], self.caplog.messages)
+        self.assertEqual("doc/index.rst", warnings.get_checker("sphinx").cq_findings[0]["location"]["path"])
+
+    def test_coverity_defect_with_ansi(self):
+        warnings = WarningsPlugin()
+        warnings.activate_checker_name("coverity", True, None)
+        warnings.check("\x1b[1m/src/somefile.c:82: CID 113396 (#2 of 2): Coding standard violation (MISRA C-2012 "
+                       "Rule 10.1): Unclassified, Unspecified, Undecided, owner is nobody, first detected on "
+                       "2017-07-27.\x1b[0m\n")
+        self.assertEqual(1, warnings.return_count())
+        self.assertEqual(["/src/somefile.c:82: CID 113396 (#2 of 2): Coding standard violation (MISRA C-2012 Rule "
+                          "10.1): Unclassified, Unspecified, Undecided, owner is nobody, first detected on "
+                          "2017-07-27."], self.caplog.messages)
@@ -0,0 +1,63 @@
+import pickle
+import re
+from unittest import TestCase, skipIf
+from unittest.mock import patch
+
+from mlx.warnings import WarningsConfigError, WarningsPlugin
+from mlx.warnings.patterns import PatternList
+from mlx.warnings.regex_engines import Re2Engine, RegexEngine, re2
+
+
+class TestRegexEngine(TestCase):
+
+    def test_default_engine(self):
+        engine = RegexEngine()
+        pattern = engine.compile(r"(a+)+b")
+        self.assertIsInstance(pattern, re.Pattern)
+        self.assertTrue(engine.is_native(pattern))
+        self.assertIs(re.Pattern, type(WarningsPlugin().activate_checker_name("sphinx", False, None).pattern))
+
+    def test_re2_not_installed(self):
+        with patch("mlx.warnings.regex_engines.re2", None):
+            with self.assertRaises(WarningsConfigError):
+                Re2Engine()
+
+
+@skipIf(re2 is None, "The google-re2 package is not installed")
+class TestRe2Engine(TestCase):
+
+    def setUp(self):
+        self.engine = Re2Engine()
+
+    def test_fallback(self):
+        self.assertTrue(self.engine.is_native(self.engine.compile(r"(a+)+b")))
+        for regex in (r"warning(?!: unused)", r"(\w+) is \1", r"\Z"):
+            self.assertIsInstance(self.engine.compile(regex), re.Pattern)
+
+    def test_pattern_list(self):
+        regexes = ["src/.*\\.h", "(a+)+b", "toctree(?= contains)", "deprecated"]
+        patterns = PatternList((self.engine.compile(regex) for regex in regexes), self.engine)
+        content = "a" * 100 + "c: toctree contains reference"
+        self.assertEqual("toctree(?= contains)", patterns.search(content))
+        self.assertEqual("(a+)+b", patterns.search("a" * 100 + "b"))
+        self.assertEqual("src/.*\\.h", patterns.search("src/a.h: deprecated"))
+        self.assertEqual("deprecated", pickle.loads(pickle.dumps(patterns)).search("x: deprecated"))
+        self.assertIsNone(patterns.search(content[:-20]))
+
+    def test_checkers(self):
+        warnings = WarningsPlugin()
+        warnings.regex_engine = self.engine
+        warnings.config_parser({
+            "sphinx": {"enabled": True, "min": 0, "max": 0, "exclude": ["(a+)+b", "WARNING: toctree"]},
+            "coverity": {"enabled": True, "exclude": ["CID 10"], "intentional": {"min": 0, "max": 0}},
+        }, False, None)
+        sphinx = warnings.get_checker("sphinx")
+        self.assertTrue(self.engine.is_native(sphinx.pattern))
+        self.assertTrue(self.engine.is_native(sphinx.bytes_pattern))
+        self.assertIs(self.engine, warnings.get_checker("coverity").checkers["intentional"].regex_engine)
+        warnings.check("index.rst:5: WARNING: toctree contains a reference\n"
+                       "index.rst:6: WARNING: " + "a" * 100 + "\n"
+                       "/src/a.c:82: CID 10 (#1 of 1): Bad (RULE): Intentional, Unspecified, Undecided, owner\n"
+                       "/src/a.c:83: CID 11 (#1 of 1): Bad (RULE): Intentional, Unspecified, Undecided, owner\n")
+        self.assertEqual(1, sphinx.return_count())
+        self.assertEqual(1, warnings.get_checker("coverity").return_count())
@@ -1,3 +1,4 @@
+import pickle
 import unittest
 
 import pytest
@@ -142,6 +143,33 @@ class TestRobotWarnings(unittest.TestCase):
                 self.warnings.return_count()
         self.assertEqual(str(exc.exception), "1 test suites have been ignored due to incomplete configuration: ['Empty Flash Product Id']")
 
+    def test_suffix_suite_names(self):
+        self.dut.checkers = [
+            RobotSuiteChecker("One", *self.dut.logging_args),
+            RobotSuiteChecker("Suite One", *self.dut.logging_args),
+            RobotSuiteChecker("", *self.dut.logging_args),
+            RobotSuiteChecker("Suite Two", *self.dut.logging_args),
+        ]
+        content = ('<testsuite name="Root">'
+                   '<testcase classname="Root.Suite One" name="First Test"><failure message="fail"/></testcase>'
+                   '<testcase classname="Root.One" name="Second Test"><failure message="fail"/></testcase>'
+                   '<testcase classname="Root.Three" name="Third Test"><error message="error"/></testcase>'
+                   '</testsuite>')
+        self.warnings.check(content)
+        self.assertEqual([2, 1, 3, 0], [checker.return_count() for checker in self.dut.checkers])
+        self.assertEqual([], self.dut.ignored_testsuites)
+        self.assertEqual(["Root.Suite One.First Test"] * 3 + ["Root.One.Second Test"] * 2 + ["Root.Three.Third Test"],
+                         self.caplog.messages)
+
+    def test_ignored_testcases_of_suite(self):
+        checker = RobotSuiteChecker("Suite One", *self.dut.logging_args)
+        with open("tests/test_in/robot_double_fail.xml") as xmlfile:
+            checker.check(xmlfile.read())
+        copy = pickle.loads(pickle.dumps(checker))
+        copy.merge(checker)
+        self.assertEqual({"Suite One &amp; Suite Two.Suite Two": 4}, dict(copy.ignored_testsuites))
+        self.assertEqual(1, checker.return_count())
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,8 +1,14 @@
+import io
+import tempfile
+from pathlib import Path
 from unittest import TestCase
+from unittest.mock import patch
 
 import pytest
 
 from mlx.warnings import WarningsPlugin
+from mlx.warnings.regex_checker import RegexScanner
+from mlx.warnings.warnings import map_ascii_file
 
 
 class TestWarningsPlugin(TestCase):
@@ -148,3 +154,171 @@ class TestWarningsPlugin(TestCase):
         invalid_checker_name = "non-existent"
         warnings.activate_checker_name(invalid_checker_name, *self.logging_args)
         self.assertEqual([f"Checker {invalid_checker_name} does not exist"], self.caplog.messages)
+
+    def test_check_logfile_in_chunks(self):
+        for chunk_size in (1, 2, 7, 64, 2 ** 20):
+            warnings = WarningsPlugin()
+            warnings.chunk_size = chunk_size
+            for name in ("sphinx", "doxygen", "xmlrunner", "coverity"):
+                warnings.activate_checker_name(name, *self.logging_args)
+            for path in ("tests/test_in/mixed_warnings.txt", "tests/test_in/coverity_full.txt"):
+                with open(path) as logfile:
+                    warnings.check_logfile(io.StringIO(logfile.read()))
+            reference = WarningsPlugin()
+            for name in ("sphinx", "doxygen", "xmlrunner", "coverity"):
+                reference.activate_checker_name(name, *self.logging_args)
+            for path in ("tests/test_in/mixed_warnings.txt", "tests/test_in/coverity_full.txt"):
+                with open(path) as logfile:
+                    reference.check(logfile.read())
+            for name in ("sphinx", "doxygen", "xmlrunner", "coverity"):
+                self.assertEqual(reference.return_count(name), warnings.return_count(name))
+
+    def test_regex_scanner(self):
+        names = ("sphinx", "doxygen", "xmlrunner", "coverity")
+        with open("tests/test_in/mixed_warnings.txt") as logfile:
+            content = logfile.read()
+        with open("tests/test_in/coverity_full.txt") as logfile:
+            content += logfile.read()
+        reference = WarningsPlugin()
+        for name in names:
+            reference.activate_checker_name(name, True, None).check(content)
+        expected_messages = sorted(self.caplog.messages)
+        padding = b"index.rst:1: WARNING: beyond the end\nCID 1 (#1 of 1): Beyond the end: Bug,\n"
+
+        def feed_in_chunks(scanner):
+            for index in range(0, len(content), 5):
+                scanner.feed(content[index:index + 5])
+            scanner.flush()
+
+        for scan in (lambda scanner: scanner.check(content),
+                     lambda scanner: scanner.check_buffer(content.encode()),
+                     # a view of the start of a larger buffer, e.g. of a block of shared memory
+                     lambda scanner: scanner.check_buffer(memoryview(content.encode() + padding)[:len(content)]),
+                     feed_in_chunks):
+            self.caplog.clear()
+            warnings = WarningsPlugin()
+            scan(RegexScanner([warnings.activate_checker_name(name, True, None) for name in names]))
+            for name in names:
+                self.assertEqual(reference.return_count(name), warnings.return_count(name))
+            self.assertEqual(expected_messages, sorted(self.caplog.messages))
+
+    def test_counts_only(self):
+        names = ("sphinx", "doxygen", "xmlrunner")
+        with open("tests/test_in/mixed_warnings.txt") as logfile:
+            content = logfile.read()
+        reference = WarningsPlugin()
+        for name in names:
+            self.assertFalse(reference.activate_checker_name(name, True, None).counts_only)
+        reference.check(content)
+        self.caplog.clear()
+        warnings = WarningsPlugin()
+        checkers = [warnings.activate_checker_name(name, *self.logging_args) for name in names]
+        self.assertTrue(all(checker.counts_only for checker in checkers))
+        warnings.check(content)
+        with open("tests/test_in/mixed_warnings.txt") as logfile:
+            warnings.check_logfile(logfile)
+        for checker in checkers:
+            checker.check(content)
+            self.assertEqual(3 * reference.return_count(checker.name), checker.return_count())
+        self.assertEqual([], self.caplog.messages)
+        checkers[0].cq_enabled = True
+        checkers[1].add_patterns(["Notice"], checkers[1].exclude_patterns)
+        self.assertEqual([False, False, True], [checker.counts_only for checker in checkers])
+        self.assertFalse(warnings.activate_checker_name("coverity", *self.logging_args).counts_only)
+
+    def test_literals_of_regex_checkers(self):
+        warnings = WarningsPlugin()
+        checkers = [warnings.activate_checker_name(name, *self.logging_args)
+                    for name in ("sphinx", "doxygen", "xmlrunner", "coverity")]
+        sphinx_deprecation = WarningsPlugin().activate_checker_name("sphinx", *self.logging_args)
+        sphinx_deprecation.include_sphinx_deprecation()
+        for path in Path("tests/test_in").glob("*.txt"):
+            content = path.read_text()
+            for checker in checkers + [sphinx_deprecation]:
+                for match in checker.pattern.finditer(content):
+                    self.assertTrue(any(literal in line for literal in checker.literals
+                                        for line in match.group(0).splitlines()), f"{checker.name}: {match[0]!r}")
+
+    def test_exclusion_cache(self):
+        warnings = WarningsPlugin()
+        checker = warnings.activate_checker_name("doxygen", *self.logging_args)
+        checker.add_patterns(["unused"], checker.exclude_patterns)
+        content = "".join(f"src/{name}.c:1: warning: unused variable 'x'\nsrc/{name}.c:2: warning: shadowed\n"
+                          for name in ("a", "a", "a", "b"))
+        warnings.check(content)
+        self.assertEqual(4, warnings.return_count())
+        self.assertEqual((4, 4, 4096, 4), checker.exclusion_cache_info())
+        checker.add_patterns(["shadowed"], checker.exclude_patterns)
+        checker.add_patterns([r"src/b\.c"], checker.include_patterns)
+        warnings.check(content)
+        self.assertEqual(6, warnings.return_count())
+        self.assertEqual((8, 8, 4096, 4), checker.exclusion_cache_info())
+
+    def test_exclusion_cache_size(self):
+        warnings = WarningsPlugin()
+        checker = warnings.activate_checker_name("sphinx", *self.logging_args)
+        checker.add_patterns(["toctree"], checker.exclude_patterns)
+        with patch("mlx.warnings.warnings_checker.EXCLUSION_CACHE_SIZE", 2):
+            warnings.check("WARNING: a\nWARNING: b\nWARNING: a\nWARNING: c\nWARNING: b\nWARNING: b\n")
+        self.assertEqual((2, 4, 4096, 2), checker.exclusion_cache_info())
+
+    def test_fail_fast(self):
+        warnings = WarningsPlugin()
+        warnings.activate_checker_name("doxygen", *self.logging_args)
+        warnings.activate_checker_name("junit", *self.logging_args)
+        warnings.toggle_fail_fast(True)
+        warnings.configure_maximum(1)
+        with open("tests/test_in/doxygen_warnings.txt") as logfile:
+            warnings.check(logfile.read())
+        self.assertEqual(2, warnings.return_count("doxygen"))
+        self.assertFalse(warnings.is_outcome_fixed())
+        with open("tests/test_in/junit_double_fail.xml") as logfile:
+            warnings.check(logfile.read())
+        self.assertTrue(warnings.is_outcome_fixed())
+        with open("tests/test_in/junit_double_fail.xml") as logfile:
+            warnings.check(logfile.read())
+        self.assertEqual(2, warnings.return_count("junit"))
+
+    def test_fail_fast_coverity(self):
+        warnings = WarningsPlugin()
+        checker = warnings.activate_checker_name("coverity", *self.logging_args)
+        warnings.toggle_fail_fast(True)
+        with open("tests/test_in/coverity_full.txt") as logfile:
+            warnings.check_logfile(logfile)
+        # the sub-checkers for 'pending' and 'bug' don't exceed their maximum, so the whole file is parsed
+        self.assertFalse(checker.is_outcome_fixed())
+        self.assertEqual([8, 0, 0, 1, 2], [sub_checker.return_count() for sub_checker in checker.checkers.values()])
+
+    def test_check_logfile_warning_spanning_chunks(self):
+        warnings = WarningsPlugin()
+        warnings.chunk_size = 4
+        warnings.activate_checker_name("sphinx", *self.logging_args)
+        warnings.check_logfile(io.StringIO("index.rst:5:\n\nWARNING:\n  toctree contains a reference\nINFO: done"))
+        self.assertEqual(warnings.return_count(), 2)
+
+    def test_check_logfile_memory_mapped(self):
+        warnings = WarningsPlugin()
+        warnings.activate_checker_name("sphinx", *self.logging_args)
+        warnings.activate_checker_name("doxygen", *self.logging_args)
+        warnings.activate_checker_name("junit", *self.logging_args)
+        with open("tests/test_in/mixed_warnings.txt") as logfile:
+            buffer = map_ascii_file(logfile)
+            self.assertIsNotNone(buffer)
+            buffer.close()
+            warnings.check_logfile(logfile)
+        reference = WarningsPlugin()
+        reference.activate_checker_name("sphinx", *self.logging_args)
+        reference.activate_checker_name("doxygen", *self.logging_args)
+        with open("tests/test_in/mixed_warnings.txt") as logfile:
+            reference.check(logfile.read())
+        self.assertEqual(reference.return_count("sphinx"), warnings.return_count("sphinx"))
+        self.assertEqual(reference.return_count("doxygen"), warnings.return_count("doxygen"))
+        self.assertEqual(0, warnings.return_count("junit"))
+
+    def test_map_ascii_file_unsupported(self):
+        for content in (b"", "index.rst:5: WARNING: \u2018x\u2019\n".encode("utf-8"), b"index.rst:5: WARNING: x\r\n",
+                        b"\x1b[31mWARNING: x\n"):
+            with tempfile.TemporaryFile("w+b") as tmp:
+                tmp.write(content)
+                tmp.flush()
+                self.assertIsNone(map_ascii_file(tmp))